@@ -34,14 +34,14 @@ class EnvironmentVariableManager:
 
         """
 
-        potentially_sensitive = {
-            key: value
-            for key, value in self.final_vars.items()
-            if is_potentially_sensitive_key_value(key, value)
-        }
-        not_potentially_sensitive = {
-            key: value
-            for key, value in self.final_vars.items()
-            if not is_potentially_sensitive_key_value(key, value)
-        }
+        potentially_sensitive = {}
+        not_potentially_sensitive = {}
+
+        # Partition the variables in a single pass, checking each of them once
+        for key, value in self.final_vars.items():
+            if is_potentially_sensitive_key_value(key, value):
+                potentially_sensitive[key] = value
+            else:
+                not_potentially_sensitive[key] = value
+
         return not_potentially_sensitive, potentially_sensitive
@@ -30,7 +30,7 @@ class InitOption:
 
         assert default is not None
 
-        if "type" in options_set.keys():
+        if "type" in options_set:
             _t = type_tool(options_set["type"])
             default = _t(default)
 
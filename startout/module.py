@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import shutil
 import subprocess
 import sys
@@ -5,7 +7,7 @@ from pathlib import Path
 from typing import List, Dict, Tuple
 
 from rich.console import Console
-from schema import Schema, And, Or, Optional, Use
+from schema import Schema, Or, Optional
 
 from startout.init_option import InitOption
 from startout.util import (
@@ -18,18 +20,21 @@ from startout.util import (
     is_yaml_loadable_type,
 )
 
+# The scripts of a Module, given at the top level and optionally overridden for each platform
+_MODULE_SCRIPTS_SCHEMA = {Optional(str): str}
+# A Module is collected from exactly one kind of source
+_MODULE_SOURCE_SCHEMA = Schema({Or("git", "script", only_one=True): str})
+
 
 def check_for_key(name: str, key: str, scripts: dict):
     all_platform_keys = [
-        platforms
-        for platforms in scripts.keys()
-        if platforms in ["windows", "mac", "linux"]
+        platforms for platforms in scripts if platforms in ["windows", "mac", "linux"]
     ]
 
     # The key must be in the top level (not platform-specific) unless it is specified in EACH platform-specific set
 
     # If the key is not at the top level...
-    if key not in scripts.keys():
+    if key not in scripts:
         # ...and the three supported platforms are not also all specified...
         if len(all_platform_keys) != 3:
             # ...then it is impossible for the script to have been fully defined.
@@ -40,7 +45,7 @@ def check_for_key(name: str, key: str, scripts: dict):
             # If all platforms have a set of scripts, make sure that this script is in each of them
             missing_platforms = []
             for _platform in all_platform_keys:
-                if key not in scripts[_platform].keys():
+                if key not in scripts[_platform]:
                     missing_platforms.append(_platform)
             if len(missing_platforms) > 0:
                 raise TypeError(
@@ -67,20 +72,31 @@ class Module:
         is installed).
         source (dict): The source of the module, given as any ONE of [git, curl, script, docker].
         scripts (dict): Scripts associated with the module.
-        dependencies (str or list[str]): Dependencies of the module. (Optional)
+        dependencies (frozenset[str]): Dependencies of the module. (Optional)
         init_options (list[dict]): Initialization options for the module. (Optional)
 
     """
 
+    __slots__ = (
+        "name",
+        "dest",
+        "source",
+        "scripts",
+        "dependencies",
+        "init_options",
+        "_resolved_scripts",
+    )
+
+    # The fields that make up a Module, compared by __eq__ (unlike the memo of resolved scripts, which grows on use)
+    _fields = ("name", "dest", "source", "scripts", "dependencies", "init_options")
+
     module_scripts_schema = Schema(
-        Or(
-            {
-                Optional(str): str,
-                Optional("windows"): {Optional(str): str},
-                Optional("mac"): {Optional(str): str},
-                Optional("linux"): {Optional(str): str},
-            },
-        )
+        {
+            **_MODULE_SCRIPTS_SCHEMA,
+            Optional("windows"): _MODULE_SCRIPTS_SCHEMA,
+            Optional("mac"): _MODULE_SCRIPTS_SCHEMA,
+            Optional("linux"): _MODULE_SCRIPTS_SCHEMA,
+        }
     )
     module_init_options_schema = Schema(
         {
@@ -92,8 +108,8 @@ class Module:
     )
     module_schema = Schema(
         {
-            "dest": And(str, Use(replace_env)),
-            "source": Schema({Or("git", "script", only_one=True): str}),
+            "dest": str,
+            "source": _MODULE_SOURCE_SCHEMA,
             "scripts": module_scripts_schema,
             Optional("depends_on"): Or(str, validate_str_list),
             Optional("init_options"): [module_init_options_schema],
@@ -116,23 +132,27 @@ class Module:
         :param dest: The destination path of the module.
         :param source: The source path of the module.
         :param scripts: A dictionary mapping script names to script paths.
-        :param dependencies: (optional) A list of module names that this module depends on. Defaults to None.
+        :param dependencies: (optional) A list of module names that this module depends on, stored as a frozenset.
+            Defaults to None.
         :param init_options: (optional) Additional options for module initialization. Defaults to None.
         """
 
-        # These calls will raise an exception if the script is not present
-        get_script("init", scripts, name)
-        get_script("destroy", scripts, name)
+        # Resolve each required script for this platform once, these calls will raise an exception if it is not present
+        self._resolved_scripts = {
+            script: get_script(script, scripts, name) for script in ("init", "destroy")
+        }
 
         self.name = name
         self.dest = dest
         self.source = source
         self.scripts = scripts
-        self.dependencies = dependencies
+        self.dependencies = None if dependencies is None else frozenset(dependencies)
         self.init_options = init_options
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+        return isinstance(other, self.__class__) and all(
+            getattr(self, attr) == getattr(other, attr) for attr in Module._fields
+        )
 
     def __hash__(self):
         return hash(
@@ -140,7 +160,7 @@ class Module:
                 self.get_name(),
                 self.get_dest(),
                 self.get_source(),
-                str(self.dependencies),
+                self.dependencies,
                 str(self.scripts),
                 str(self.init_options),
             )
@@ -159,7 +179,7 @@ class Module:
         self,
         script: str,
         print_output: bool = False,
-        monitor_output: MonitorOutput or None = None,
+        monitor_output: MonitorOutput | None = None,
     ) -> Tuple[str, int]:
         """
         Runs a script with environment variable substitutions.
@@ -171,11 +191,16 @@ class Module:
         """
         if script not in self.scripts:
             raise ValueError(
-                f"Module \"{self.name}\" does not have script '{script}' in {list(self.scripts.keys())}"
+                f"Module \"{self.name}\" does not have script '{script}' in {list(self.scripts)}"
             )
 
+        _script = self._resolved_scripts.get(script)
+        if _script is None:
+            _script = get_script(script, self.scripts, self.get_name())
+            self._resolved_scripts[script] = _script
+
         response, code = run_script_with_env_substitution(
-            get_script(script, self.scripts, self.get_name()),
+            _script,
             monitor_output=monitor_output,
         )
 
@@ -184,9 +209,7 @@ class Module:
 
         return response, code
 
-    def initialize(
-        self, console: Console or None = None, log_path: Path or None = None
-    ):
+    def initialize(self, console: Console | None = None, log_path: Path | None = None):
         """
         Run the Module's 'init' script.
 
@@ -212,7 +235,7 @@ class Module:
             )
             return True
 
-    def destroy(self, console: Console or None = None, log_path: Path or None = None):
+    def destroy(self, console: Console | None = None, log_path: Path | None = None):
         """
         Run the Module's 'destroy' script.
 
@@ -262,9 +285,9 @@ class GitModule(Module):
 
     """
 
-    def initialize(
-        self, console: Console or None = None, log_path: Path or None = None
-    ):
+    __slots__ = ()
+
+    def initialize(self, console: Console | None = None, log_path: Path | None = None):
         """
         Initializes the object by cloning `self.source` (a repository) to `self.dest` (a directory).
 
@@ -291,7 +314,7 @@ class GitModule(Module):
             )
         else:
             result = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
             )
 
         if result.returncode != 0:
@@ -327,9 +350,9 @@ class GitModule(Module):
 
 
 class ScriptModule(Module):
-    def initialize(
-        self, console: Console or None = None, log_path: Path or None = None
-    ):
+    __slots__ = ()
+
+    def initialize(self, console: Console | None = None, log_path: Path | None = None):
         msg, code = run_script_with_env_substitution(self.get_source())
 
         if code != 0:
@@ -364,6 +387,13 @@ class ScriptModule(Module):
                 return True
 
 
+# The type of Module instantiated for each source mode
+MODULE_TYPES = {
+    "git": GitModule,
+    "script": ScriptModule,
+}
+
+
 def create_module(module: dict, name: str):
     """
     Create a module object based on the given parameters. The value of module.source determines the type of module.
@@ -374,27 +404,21 @@ def create_module(module: dict, name: str):
     """
     mode = next(iter(module["source"]))
     source = module["source"][mode]
-    dest = module["dest"]
+    # Environment variables are substituted here rather than during validation, keeping module_schema a pure check
+    dest = replace_env(module["dest"])
 
     options = None
-    if "init_options" in module.keys():
+    options_sets = module.get("init_options")
+    if options_sets is not None:
         options = []
-        for options_set in module["init_options"]:
+        for options_set in options_sets:
             options.append(InitOption(options_set))
-    dependencies = None
-    if "depends_on" in module.keys():
-        _deps = module["depends_on"]
-        if type(_deps) is str:
-            dependencies = [_deps]
-        else:
-            dependencies = _deps
+    dependencies = module.get("depends_on")
+    if type(dependencies) is str:
+        dependencies = [dependencies]
 
     # Instantiate the correct type of Module
-    _T = Module
-    if mode == "git":
-        _T = GitModule
-    elif mode == "script":
-        _T = ScriptModule
+    _T = MODULE_TYPES.get(mode, Module)
 
     return _T(
         name=name,
@@ -179,10 +179,8 @@ def initialize_path_instance(
 
 
 def do_starter_init(starter: Starter, env_manager: EnvironmentVariableManager):
-    init_options = starter.get_init_options()
-
     responses = {}
-    for module_name, options in init_options:
+    for module_name, options in starter.iter_init_options():
         for option in options:
             response = prompt_init_option(option)
             responses[(module_name, option.name)] = response
@@ -331,8 +329,8 @@ def new_repo_owner_interactive() -> str:
 
 
 def initialize_repo(
-        template_owner: str or None, template_name: str or None, new_repo_owner: str or None,
-        new_repo_name: str or None, public: bool = True
+        template_owner: Optional[str], template_name: Optional[str], new_repo_owner: Optional[str],
+        new_repo_name: Optional[str], public: bool = True
 ):
     # If any environment variables are missing, prompt the user for them interactively
 
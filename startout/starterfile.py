@@ -1,18 +1,67 @@
+from __future__ import annotations
+
+import functools
+import hashlib
 import itertools
+import json
 import os
+import re
+import shutil
 import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TextIO, List, Tuple
+from stat import S_ISDIR, S_ISREG
+from typing import TYPE_CHECKING, TextIO, List, Tuple
 
 import yaml
-from dotenv import load_dotenv
-from rich.console import Console
 from schema import Schema, And, Or, Optional, Use
 
 from startout.module import Module, create_module
 from startout.tool import Tool, InstallationStatus, should_rollback, InstallationMode
 from startout.util import replace_env
 
+try:
+    # The LibYAML bindings parse several times faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Upper bound on the number of tools or modules of a single dependency layer installed at the same time. Their scripts
+#  mostly wait on the network and disk, so this is a multiple of the CPU count (capped for large machines)
+MAX_LAYER_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+# Result of an item of a dependency layer that was never started because another item of the layer failed
+_SKIPPED = object()
+
+# Digests of the contents of Starterfiles that passed validation during this process
+_VALIDATED_STARTERFILES = set()
+
+
+def _user_cache_dir() -> str:
+    """
+    The directory for the Starterfile cache of the current user, e.g. ~/.cache/startout.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(
+            os.path.expanduser("~"), "AppData", "Local"
+        )
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+
+    return os.path.join(base, "startout")
+
+
+# Directory holding the loaded contents of Starterfiles as JSON, which is much faster to load than YAML. The entries
+#  hold the scripts that will be run, so it must be private to the user (see `_starterfile_cache_dir`)
+STARTERFILE_CACHE_DIR = _user_cache_dir()
+
 
 class Starter:
     """
@@ -74,10 +123,26 @@ class Starter:
         get_init_options()
             Placeholder method for getting the initialization options.
 
+        iter_init_options()
+            Lazily yields the initialization options, see get_init_options().
+
         set_init_options(options)
             Placeholder method for setting the initialization options.
     """
 
+    __slots__ = (
+        "modules",
+        "tools",
+        "module_dependencies",
+        "tool_dependencies",
+        "env_replacement_targets",
+        "env_dump_file",
+        "env_dump_mode",
+        "_tools_by_name",
+        "_modules_by_name",
+        "_check_results",
+    )
+
     env_dump_schema = Schema(
         {
             "target": And(str, len),
@@ -86,9 +151,10 @@ class Starter:
     )
     starterfile_schema = Schema(
         {
-            "tools": And(dict, len),
-            "modules": And(dict, len),
-            Optional("env_file"): And(Or(Use(list), None)),
+            # Each tool and module is validated along with the rest of the Starterfile, in a single pass
+            "tools": And({str: Tool.tool_schema}, len),
+            "modules": And({str: Module.module_schema}, len),
+            Optional("env_file"): Or(Use(list), None),
             Optional("env_replace"): And(list, len),
             Optional("env_dump"): env_dump_schema,
         }
@@ -121,6 +187,16 @@ class Starter:
         self.tool_dependencies = tool_dependencies
         self.env_replacement_targets = env_replacement_targets
 
+        # Index the tools and modules by name, the dependency layers refer to them by name
+        self._tools_by_name = {tool.name: tool for tool in tools}
+        self._modules_by_name = {}
+        # The first of any modules sharing a name is the one found, as by a scan of self.modules
+        for module in modules:
+            self._modules_by_name.setdefault(module.name, module)
+
+        # Results of the tools' check scripts by name, kept until the tool is installed or destroyed
+        self._check_results = {}
+
         if env_dump is None:
             self.env_dump_file = None
             self.env_dump_mode = None
@@ -141,10 +217,11 @@ class Starter:
 
     def up(
         self,
-        console: Console or None = None,
-        log: Path or None = None,
+        console: Console | None = None,
+        log: Path | None = None,
         teardown_on_failure=True,
         fail_early=True,
+        parallel=False,
     ):
         """
         Installs all Tools, all Modules, and performs environment variable replacement on a Startersteps.md file (if
@@ -154,13 +231,14 @@ class Starter:
         :param log:
         :param teardown_on_failure: A boolean flag to determine whether to perform teardown operations if any failure occurs during the method execution. Default value is `True`.
         :param fail_early: A boolean flag to determine whether to abort the process as soon as a tool or module fails to initialize. Default value is `False`.
+        :param parallel: A boolean flag to determine whether the tools or modules within a dependency layer are installed concurrently. Their scripts often use package managers that take a lock or prompt for a password (e.g. `sudo apt install`), so default value is `False`.
         :return: A boolean value indicating whether the tools and modules installation was successful. Returns `True` if both tools and modules were installed successfully, otherwise returns `False`.
         """
         tools_installed = self.install_tools(
-            teardown_on_failure, fail_early, console, log
+            teardown_on_failure, fail_early, console, log, parallel=parallel
         )
         modules_installed = self.install_modules(
-            console, log, teardown_on_failure, fail_early
+            console, log, teardown_on_failure, fail_early, parallel=parallel
         )
 
         if not tools_installed:
@@ -170,13 +248,23 @@ class Starter:
 
         # If a Startersteps.md file is present, perform environment variable replacement
         if Path("Startersteps.md").is_file():
-            new_lines = []
-            with open("Startersteps.md", "r") as steps_in:
-                new_lines.extend(steps_in.readlines())
-
-            with open("Startersteps.md", "w") as steps_out:
-                for line in new_lines:
-                    steps_out.write(replace_env(line))
+            # Stream into a sibling file and swap it in, rather than buffering the whole file
+            fd, temp_path = tempfile.mkstemp(
+                dir=".", prefix=".Startersteps.md.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as steps_out, open(
+                    "Startersteps.md", "r"
+                ) as steps_in:
+                    for line in steps_in:
+                        steps_out.write(replace_env(line))
+
+                # Keep the permissions of the original file, rather than the 0600 of the temporary one
+                shutil.copymode("Startersteps.md", temp_path)
+                os.replace(temp_path, "Startersteps.md")
+            except BaseException:
+                os.unlink(temp_path)
+                raise
 
         return tools_installed and modules_installed
 
@@ -184,14 +272,18 @@ class Starter:
         self,
         teardown_on_failure=True,
         fail_early=True,
-        console: Console or None = None,
-        log: Path or None = None,
-        assumption: bool or None = None,
+        console: Console | None = None,
+        log: Path | None = None,
+        assumption: bool | None = None,
+        parallel=False,
     ):
         """
         Install tools layer by layer so that their dependencies are all met before being installed.
 
-        :param assumption: When asking for input, assumes True or False if set
+        :param assumption: When asking which optional tools to install, assumes True or False for all of them if set
+        :param parallel: If True, the tools within each layer are installed concurrently. The check scripts of the tools
+            are read-only, so they are always run concurrently.
+        :type parallel: bool
         :param teardown_on_failure: If True, rollback other tools if any tool installation fails.
         :type teardown_on_failure: bool
         :param fail_early: If True, function will return false as soon as a tool fails to initialize.
@@ -207,73 +299,134 @@ class Starter:
 
         print("Installing tools...")
 
-        for tool in (
-            tool for tool in self.tools if tool.mode == InstallationMode.OPTIONAL
-        ):
+        # Bind the enum members used for every tool to locals
+        mode_install = InstallationMode.INSTALL
+        mode_optional = InstallationMode.OPTIONAL
+        status_existing = InstallationStatus.EXISTING_INSTALLATION
+        status_new = InstallationStatus.NEWLY_INSTALLED
+        status_none = InstallationStatus.NOT_INSTALLED
+
+        optional_tools = [tool for tool in self.tools if tool.mode == mode_optional]
+
+        # Ask about all optional tools at once, unless an assumption is given
+        chosen_tools = set()
+        if optional_tools and assumption is None:
+            response = console.input(
+                f"[input_prompt]Install any of these optional tools? "
+                f"{', '.join(tool.name for tool in optional_tools)} "
+                f"(comma-separated names, leave blank for none): [/]"
+            )
+            chosen_tools = {name.strip().lower() for name in response.split(",")}
+
+        for tool in optional_tools:
             if assumption is None:
-                potential_response = (
-                    console.input(
-                        f"[input_prompt]Install {tool.name}? (y/N): [/]"
-                    ).lower
-                    == "y"
-                )
+                potential_response = tool.name.lower() in chosen_tools
             else:
                 potential_response = assumption
 
-            tool.mode = (
-                InstallationMode.INSTALL
-                if potential_response
-                else InstallationMode.OPTIONAL
+            tool.mode = mode_install if potential_response else mode_optional
+
+        # Check scripts are read-only, so every tool to be installed is checked up front, all at once,
+        #  unless its result is still known from an earlier run. Tools are taken from the index by name, so that a
+        #  tool listed more than once is only checked once. Installing a tool may also install the tools that depend
+        #  on it (e.g. node brings npm), so their results are forgotten and checked again once it is newly installed
+        checked_tools = self._check_results
+        tools_to_check = [
+            tool
+            for tool in self._tools_by_name.values()
+            if tool.mode == mode_install and tool.name not in checked_tools
+        ]
+        checked_tools.update(
+            zip(
+                (tool.name for tool in tools_to_check),
+                _map_layer(lambda tool: tool.check(), tools_to_check, True),
             )
+        )
+
+        # The tools that depend on each tool
+        dependents = {}
+        for tool in self._tools_by_name.values():
+            for dependency in tool.dependencies or ():
+                dependents.setdefault(dependency, []).append(tool.name)
 
         failed_tools = []
         successful_tools = []
+
+        # Occurrences of each tool name in the current and remaining dependency layers
+        remaining_tools = Counter(itertools.chain.from_iterable(self.tool_dependencies))
+
         current_layer = -1
         for layer in self.tool_dependencies:
             # Install tools layer by layer so that their dependencies are all met before being installed
             current_layer += 1
             early_exit = False
 
-            for tool in (
+            layer_tools = [
                 tool
-                for tool in self.tools
-                if tool.name in layer
-                if tool.mode == InstallationMode.INSTALL
-            ):
-                # Use the tool's check function to prevent attempts to install an existing tool
-                if tool.check():
-                    print(f".. Tool '{tool.name}' is already installed, skipping.")
-                    tool.status = InstallationStatus.EXISTING_INSTALLATION
-                    continue
+                for tool in map(self._tools_by_name.get, layer)
+                if tool is not None and tool.mode == mode_install
+            ]
+
+            # Alts of failed tools are added to this layer and installed in a further pass over it
+            while layer_tools:
+                results = _map_layer(
+                    lambda tool: _check_and_initialize_tool(tool, checked_tools),
+                    layer_tools,
+                    parallel,
+                    should_stop=_tool_failed if fail_early else None,
+                )
+                pending_alts = []
+                # The outcome of each tool in this pass is reported in a single write once the pass is done
+                report = []
+
+                for tool, installed in zip(layer_tools, results):
+                    if installed is _SKIPPED:
+                        report.append(f".. Tool '{tool.name}' skipped.")
+                        continue
+
+                    # The tool's check function prevented an attempt to install an existing tool
+                    if installed is None:
+                        report.append(
+                            f".. Tool '{tool.name}' is already installed, skipping."
+                        )
+                        tool.status = status_existing
+                        continue
+
+                    # Adding this tool to the list of failures if it could not be initialized
+                    if not installed:
+                        if tool.alt is None:
+                            report.append(f".. Tool '{tool.name}' failed to install.")
+                            failed_tools.append(tool.name)
+                            tool.status = status_none
+                            if fail_early:
+                                early_exit = True
+                        else:
+                            alt = self._tools_by_name.get(tool.alt)
+
+                            report.append(
+                                f".. Tool '{tool.name}' failed to install, will use alt '{alt.name}' instead."
+                            )
+                            alt.mode = mode_install
+
+                            # Add the alt to this dependency layer if it is not already accounted for
+                            if remaining_tools[alt.name] == 0:
+                                self.tool_dependencies[current_layer].append(alt.name)
+                                remaining_tools[alt.name] += 1
+                                pending_alts.append(alt)
 
-                # Initialize this tool, adding it to the list of failures if it cannot be initialized
-                if not tool.initialize():
-                    if tool.alt is None:
-                        print(f".. Tool '{tool.name}' failed to install.")
-                        failed_tools.append(tool.name)
-                        tool.status = InstallationStatus.NOT_INSTALLED
-                        if fail_early:
-                            early_exit = True
                     else:
-                        alt = next((t for t in self.tools if t.name == tool.alt), None)
+                        report.append(f".. Tool '{tool.name}' installed successfully.")
+                        successful_tools.append(tool.name)
+                        checked_tools.pop(tool.name, None)
+                        _forget_dependent_checks(tool.name, dependents, checked_tools)
+                        tool.status = status_new
 
-                        print(
-                            f".. Tool '{tool.name}' failed to install, will use alt '{alt.name}' instead."
-                        )
-                        alt.mode = InstallationMode.INSTALL
+                if report:
+                    print("\n".join(report))
 
-                        # Add the alt to the next dependency layer if it is not already accounted for
-                        if alt.name not in [
-                            tool_name
-                            for layer in self.tool_dependencies[current_layer:]
-                            for tool_name in layer
-                        ]:
-                            self.tool_dependencies[current_layer].append(alt.name)
+                layer_tools = pending_alts
 
-                else:
-                    print(f".. Tool '{tool.name}' installed successfully.")
-                    successful_tools.append(tool.name)
-                    tool.status = InstallationStatus.NEWLY_INSTALLED
+            remaining_tools.subtract(layer)
 
             if early_exit:
                 break
@@ -284,10 +437,11 @@ class Starter:
 
             # ... and teardown if specified
             if teardown_on_failure:
+                # Look up the installed tools by name rather than scanning every tool for each of them
                 tools_to_rollback = [
                     tool
-                    for tool in self.tools
-                    if tool.name in successful_tools and should_rollback(tool.status)
+                    for tool in map(self._tools_by_name.get, successful_tools)
+                    if should_rollback(tool.status)
                 ]
 
                 print(
@@ -311,6 +465,7 @@ class Starter:
                         sys.exit(1)
                     else:
                         destroyed_tools.append(tool.name)
+                        self._check_results.pop(tool.name, None)
 
             # If any tools failed
             return False
@@ -320,16 +475,20 @@ class Starter:
 
     def install_modules(
         self,
-        console: Console or None = None,
-        log: Path or None = None,
+        console: Console | None = None,
+        log: Path | None = None,
         teardown_on_failure=True,
         fail_early=True,
+        parallel=False,
     ):
         """
         Install modules layer by layer so that their dependencies are all met before being installed.
 
         :param log:
         :param console:
+        :param parallel: If True, the modules within each layer are initialized concurrently. Ignored when a console
+            is given, as monitored output can only be displayed for one module at a time.
+        :type parallel: bool
         :param teardown_on_failure: If True, rollback other tools if any module installation fails.
         :type teardown_on_failure: bool
         :param fail_early: If True, function will return false as soon as a tool fails to initialize.
@@ -351,15 +510,39 @@ class Starter:
             # Install modules layer by layer so that their dependencies are all met before being installed
             early_exit = False
 
-            for module in (module for module in self.modules if module.name in layer):
-                # Initialize this module, adding it to the list of failures if it cannot be initialized
-                if not module.initialize(console=console, log_path=log):
+            layer_modules = [
+                module
+                for module in map(self._modules_by_name.get, layer)
+                if module is not None
+            ]
+            results = _map_layer(
+                lambda module: module.initialize(console=console, log_path=log),
+                layer_modules,
+                parallel and console is None,
+                should_stop=(
+                    (lambda _, initialized: not initialized) if fail_early else None
+                ),
+            )
+
+            # Modules skipped in this layer are reported in a single write
+            skipped_modules = []
+
+            for module, initialized in zip(layer_modules, results):
+                if initialized is _SKIPPED:
+                    skipped_modules.append(f".. Module '{module.name}' skipped.")
+                    continue
+
+                # Add this module to the list of failures if it could not be initialized
+                if not initialized:
                     failed_modules.append(module.name)
                     if fail_early:
                         early_exit = True
                 else:
                     successful_modules.append(module.name)
 
+            if skipped_modules:
+                print("\n".join(skipped_modules))
+
             if early_exit:
                 break
 
@@ -376,11 +559,7 @@ class Starter:
                 )
 
                 destroyed_modules = []
-                for module in [
-                    module
-                    for module in self.modules
-                    if module.name in successful_modules
-                ]:
+                for module in map(self._modules_by_name.get, successful_modules):
                     if not module.destroy(console=console, log_path=log):
                         # TODO handle failure to destroy better
                         print(
@@ -401,6 +580,18 @@ class Starter:
         # If all modules were successfully initialized
         return True
 
+    def iter_init_options(self):
+        """
+        Yields tuples containing the name and init_options of modules
+        that have a non-null value for init_options in the self.modules list.
+
+        :return: A generator of tuples where each tuple contains the name and init_options
+                 of modules satisfying the condition.
+        """
+        for module in self.modules:
+            if module.init_options is not None:
+                yield module.name, module.init_options
+
     def get_init_options(self):
         """
         Returns a list of tuples containing the name and init_options of modules
@@ -409,11 +600,7 @@ class Starter:
         :return: A list of tuples where each tuple contains the name and init_options
                  of modules satisfying the condition.
         """
-        return [
-            (module.name, module.init_options)
-            for module in self.modules
-            if module.init_options is not None
-        ]
+        return list(self.iter_init_options())
 
     def set_init_options(self, options):
         """
@@ -424,24 +611,119 @@ class Starter:
                                   ("react", "MODULE_REACT_APP_NAME"): "example-react-app"}
         :return: None
         """
-        for module_name, option_name in options:
-            # Get the value from the options set
-            value = options[(module_name, option_name)]
+        environment = {}
+        options_by_module = {}
 
-            # Update the environment
-            os.environ[option_name] = str(value)
+        for (module_name, option_name), value in options.items():
+            environment[option_name] = str(value)
+
+            # Index the options of each module on first use, keeping the first of any options sharing a name
+            module_options = options_by_module.get(module_name)
+            if module_options is None:
+                module_options = options_by_module[module_name] = {}
+                for option in self._modules_by_name[module_name].init_options:
+                    module_options.setdefault(option.name, option)
 
             # Update the internal variable of the option itself
-            module = [module for module in self.modules if module.name == module_name][
-                0
-            ]
-            option = [
-                option for option in module.init_options if option.name == option_name
-            ][0]
-            option.value = value
+            module_options[option_name].value = value
+
+        # Update the environment
+        os.environ.update(environment)
+
+
+def _check_and_initialize_tool(
+    tool: Tool, checked_tools: dict | None = None
+) -> bool | None:
+    """
+    Install a tool unless its check script reports that it is already installed.
+
+    :param tool: The tool to install.
+    :param checked_tools: (optional) Results of check scripts that were already run, by tool name. The check script
+        of a tool that is not in it is run now, and its result is added to it.
+    :return: None if the tool was already installed, otherwise whether its installation succeeded.
+    """
+    installed = None if checked_tools is None else checked_tools.get(tool.name)
+    if installed is None:
+        installed = tool.check()
+        if checked_tools is not None:
+            checked_tools[tool.name] = installed
+
+    if installed:
+        return None
+
+    return tool.initialize()
+
+
+def _forget_dependent_checks(name: str, dependents: dict, checked_tools: dict):
+    """
+    Forget the results of the check scripts of every tool that depends on a tool, directly or not, so that they are
+    checked again when their layer is installed.
+
+    :param name: The name of the tool that was newly installed.
+    :param dependents: The names of the tools that directly depend on each tool, by tool name.
+    :param checked_tools: Results of check scripts that were already run, by tool name.
+    :return: None
+    """
+    stale = list(dependents.get(name, ()))
+    seen = set(stale)
+    while stale:
+        dependent = stale.pop()
+        checked_tools.pop(dependent, None)
+        for further in dependents.get(dependent, ()):
+            if further not in seen:
+                seen.add(further)
+                stale.append(further)
+
+
+def _tool_failed(tool: Tool, installed: bool | None) -> bool:
+    """
+    Whether the result of `_check_and_initialize_tool` is a failure with no alt to fall back on.
+    """
+    return installed is not None and not installed and tool.alt is None
+
+
+def _map_layer(func, items: list, parallel: bool, should_stop=None) -> list:
+    """
+    Apply `func` to every item of a dependency layer, concurrently if specified. Items within a layer do not depend on
+    each other, so their order of execution does not matter.
+
+    :param func: The function to call on each item.
+    :param items: The items of the layer.
+    :param parallel: If True, call `func` on up to MAX_LAYER_WORKERS items at the same time.
+    :param should_stop: (optional) Called with each item and its result, if it returns True no further items are
+        started. Items that are already running are allowed to finish.
+    :return: The results of `func`, in the same order as `items`. Items that were never started have the result
+        _SKIPPED.
+    """
+    results = [_SKIPPED] * len(items)
+
+    if not parallel or len(items) < 2:
+        for index, item in enumerate(items):
+            results[index] = func(item)
+            if should_stop is not None and should_stop(item, results[index]):
+                break
+
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(MAX_LAYER_WORKERS, len(items))) as executor:
+        futures = {
+            executor.submit(func, item): index for index, item in enumerate(items)
+        }
 
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
 
-def create_dependency_layers(items: List[Module or Tool]) -> List[List[str]]:
+            index = futures[future]
+            results[index] = future.result()
+            if should_stop is not None and should_stop(items[index], results[index]):
+                for pending in futures:
+                    pending.cancel()
+
+    return results
+
+
+def create_dependency_layers(items: List[Module | Tool]) -> List[List[str]]:
     """
     Generate dependency layers based on the given items such that each inner list's dependencies are all contained
     within the preceding inner list (the first inner list has no dependencies).
@@ -451,9 +733,6 @@ def create_dependency_layers(items: List[Module or Tool]) -> List[List[str]]:
     :return: a list of lists, each containing item names grouped by their dependencies
     :rtype: list[list[str]]
     """
-    # Handle dependencies
-    dependency_layers = [[item.name for item in items if item.dependencies is None]]
-
     # Check for any unfulfilled dependencies,
     #  collect all items that are in any item's depends_on fields
     all_items_depended_upon = set(
@@ -469,41 +748,269 @@ def create_dependency_layers(items: List[Module or Tool]) -> List[List[str]]:
         print(f"ERROR: Dependency not met {unmet_dependencies}", file=sys.stderr)
         sys.exit(1)
 
-    # Modules with no dependencies are added to the first layer
+    # Count the dependencies of each item that have yet to be placed in a layer (its in-degree),
+    #  and collect the items depending on each item
+    in_degree = {}
+    dependents = {item.name: [] for item in items}
+    position = {item.name: index for index, item in enumerate(items)}
+    for item in items:
+        dependencies = set(item.dependencies or ())
+        in_degree[item.name] = len(dependencies)
+        for dependency in dependencies:
+            dependents[dependency].append(item.name)
+
+    # Items with no dependencies are added to the first layer
+    dependency_layers = [[name for name, degree in in_degree.items() if degree == 0]]
+    placed_items = len(dependency_layers[0])
+
+    # Each following layer holds the items whose last unplaced dependency was in the previous layer
+    while True:
+        next_layer = []
+        for name in dependency_layers[-1]:
+            for dependent in dependents[name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    next_layer.append(dependent)
+
+        if len(next_layer) == 0:
+            break
+
+        # Keep the items of each layer in the order they are defined in, so that runs are reproducible
+        next_layer.sort(key=position.__getitem__)
+        dependency_layers.append(next_layer)
+        placed_items += len(next_layer)
+
+    # Any items left over depend on each other
+    if placed_items < len(in_degree):
+        print(
+            f"ERROR: Could not meet dependencies for {[name for name, degree in in_degree.items() if degree > 0]}, "
+            f"may be a circular dependency.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    return dependency_layers
+
+
+def load_starterfile(starterfile_stream: TextIO):
+    """
+    Load the contents of a Starterfile, reusing the cached contents from a previous load if the file has not changed
+    since. Validation is left to the caller, as it depends on the environment at the time of parsing.
+
+    :param starterfile_stream: The stream representing the starter file.
+    :type starterfile_stream: TextIO
+    :return: The contents of the Starterfile.
+    """
+    loaded, _, _ = _load_starterfile(starterfile_stream)
+
+    return loaded
+
+
+def _is_private(file_stat) -> bool:
+    """
+    Whether a file or directory is owned by the current user and cannot be written to by anyone else.
+
+    :param file_stat: The result of stat on the file or directory.
+    :return: True if the file or directory is private to the current user, False otherwise.
+    """
+    if not hasattr(os, "getuid"):
+        # Windows, where the cache is under the profile of the user
+        return True
+
+    return file_stat.st_uid == os.getuid() and not file_stat.st_mode & 0o022
+
+
+def _starterfile_cache_dir(create: bool = False) -> str | None:
+    """
+    The directory of the Starterfile cache, provided it is a directory private to the current user.
+
+    :param create: Whether to create the directory (with mode 0700) if it does not exist.
+    :return: The path of the directory, or None if it does not exist or cannot be trusted.
+    """
+    try:
+        if create:
+            os.makedirs(STARTERFILE_CACHE_DIR, mode=0o700, exist_ok=True)
+        dir_stat = os.lstat(STARTERFILE_CACHE_DIR)
+        if not S_ISDIR(dir_stat.st_mode):
+            return None
+
+        # Directories of the user that were created looser than 0700 (e.g. before this check existed) are tightened
+        if hasattr(os, "getuid") and dir_stat.st_uid == os.getuid():
+            if dir_stat.st_mode & 0o077:
+                os.chmod(STARTERFILE_CACHE_DIR, 0o700)
+                dir_stat = os.lstat(STARTERFILE_CACHE_DIR)
+    except OSError:
+        return None
+
+    return STARTERFILE_CACHE_DIR if _is_private(dir_stat) else None
+
+
+@functools.lru_cache(maxsize=None)
+def _starterfile_cache_version() -> str:
+    """
+    The version of startout and of its schemas, part of the key of every cache entry so that entries written by another
+    version (which may have been validated against other schemas) are never used.
+    """
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+
+        package_version = version("startout")
+    except (ImportError, PackageNotFoundError):
+        package_version = "unknown"
+
+    # The representation of the schemas, without the addresses of the functions they use which change between runs
+    schemas = re.sub(r" at 0x[0-9a-fA-F]+", "", repr(Starter.starterfile_schema))
+
+    return f"{package_version}-{hashlib.sha1(schemas.encode()).hexdigest()}"
+
+
+def _load_starterfile(starterfile_stream: TextIO):
+    """
+    Load the contents of a Starterfile as `load_starterfile` does.
+
+    :param starterfile_stream: The stream representing the starter file.
+    :return: A tuple of the contents of the Starterfile, whether the cached contents have already passed validation,
+        and the cache entry of the Starterfile (its path and key) or None if it cannot be cached.
+    """
+    try:
+        path = os.path.abspath(starterfile_stream.name)
+        os.stat(path)
+    except (AttributeError, TypeError, OSError):
+        # Not backed by a file (e.g. a StringIO), so there is nothing to key a cache entry on
+        return yaml.load(starterfile_stream, Loader=SafeLoader), False, None
+
+    # The entry is keyed on a digest of the text rather than the mtime and size of the file, which an edit may leave
+    #  unchanged (e.g. a checkout or `rsync -t` restores the mtime)
+    text = starterfile_stream.read()
+    cache_entry = (
+        os.path.join(
+            STARTERFILE_CACHE_DIR, hashlib.sha1(path.encode()).hexdigest() + ".json"
+        ),
+        [
+            _starterfile_cache_version(),
+            hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest(),
+        ],
+    )
 
-    # Put remaining modules (those with dependencies) in a set
-    dependent_items = False
-    if len(dependency_layers) > 0:
-        dependent_items = set(
-            [item for item in items if item.name not in dependency_layers[0]]
+    if _starterfile_cache_dir() is not None:
+        try:
+            with open(cache_entry[0], "r") as cache_file:
+                cache_stat = os.fstat(cache_file.fileno())
+                if S_ISREG(cache_stat.st_mode) and _is_private(cache_stat):
+                    cached = json.load(cache_file)
+                    if cached["key"] == cache_entry[1]:
+                        return (
+                            cached["contents"],
+                            cached.get("validated", False) is True,
+                            cache_entry,
+                        )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    loaded = yaml.load(text, Loader=SafeLoader)
+
+    # Only cache contents that survive a round trip through JSON unchanged (e.g. no dates or non-string keys)
+    if not _write_starterfile_cache(cache_entry, loaded, validated=False):
+        cache_entry = None
+
+    return loaded, False, cache_entry
+
+
+def _write_starterfile_cache(cache_entry, contents, validated: bool) -> bool:
+    """
+    Write the contents of a Starterfile to its cache entry, unless they do not survive a round trip through JSON or
+    the cache directory is not private to the current user.
+
+    :param cache_entry: The path and key of the cache entry.
+    :param contents: The contents of the Starterfile.
+    :param validated: Whether the contents have passed validation.
+    :return: True if the cache entry was written, False otherwise.
+    """
+    cache_path, key = cache_entry
+
+    try:
+        serialized = json.dumps(
+            {"key": key, "validated": validated, "contents": contents}
         )
+        if json.loads(serialized)["contents"] != contents:
+            return False
 
-    # Add items to layers until none are left
-    while dependent_items:
-        scheduled_items = list(itertools.chain.from_iterable(dependency_layers))
+        cache_dir = _starterfile_cache_dir(create=True)
+        if cache_dir is None:
+            return False
 
-        added_items = []
-        for dependent_item in dependent_items:
-            if all(needed in scheduled_items for needed in dependent_item.dependencies):
-                added_items.append(dependent_item)
+        # mkstemp creates the file with mode 0600
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as cache_file:
+                cache_file.write(serialized)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        return False
 
-        if len(added_items) == 0:
-            print(
-                f"ERROR: Could not meet dependencies for {[item.name for item in dependent_items]}, "
-                f"may be a circular dependency.",
-                file=sys.stderr,
-            )
-            sys.exit(1)
+    return True
 
-        for added_item in added_items:
-            dependent_items.remove(added_item)
 
-        dependency_layers.append([item.name for item in added_items])
+def _starterfile_digest(contents) -> str | None:
+    """
+    Digest the contents of a Starterfile, so that repeated validation of the same contents can be skipped.
 
-    return dependency_layers
+    :param contents: The contents of the Starterfile.
+    :return: The digest, or None if the contents do not survive a round trip through JSON unchanged (so that different
+        contents, e.g. with integer and string keys, cannot share a digest).
+    """
+    try:
+        serialized = json.dumps(contents, sort_keys=True)
+        if json.loads(serialized) != contents:
+            return None
+    except (TypeError, ValueError):
+        return None
+
+    return hashlib.sha1(serialized.encode()).hexdigest()
 
 
-def parse_starterfile(starterfile_stream: TextIO) -> Starter:
+@functools.lru_cache(maxsize=None)
+def _env_file_names(path: str, mtime_ns: int, size: int) -> frozenset:
+    """
+    The names of the variables set by an env file, cached for as long as the file is unchanged.
+    """
+    from dotenv import dotenv_values
+
+    return frozenset(dotenv_values(path, interpolate=False))
+
+
+def load_env_file(path: str):
+    """
+    Load an env file into the environment without overriding variables that are already set. The file is not parsed
+    again if it is unchanged since it was last loaded and all of its variables are still set, as loading it would not
+    change anything.
+
+    :param path: The path of the env file.
+    :return: None
+    """
+    from dotenv import load_dotenv
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        print(
+            f"WARNING: Env file '{path}' could not be read, skipping.", file=sys.stderr
+        )
+        return
+
+    names = _env_file_names(path, stat.st_mtime_ns, stat.st_size)
+    if all(name in os.environ for name in names):
+        return
+
+    load_dotenv(path)
+
+
+def parse_starterfile(
+    starterfile_stream: TextIO, validate: bool | str = "auto"
+) -> Starter:
     """
     Parse a Starterfile.yaml
 
@@ -512,39 +1019,48 @@ def parse_starterfile(starterfile_stream: TextIO) -> Starter:
 
     :param starterfile_stream: The stream representing the starter file.
     :type starterfile_stream: TextIO
+    :param validate: Whether to check the Starterfile against the schemas. If "auto", the check is skipped when the
+        Starterfile is unchanged since it last passed it.
+    :type validate: bool or str
     :return: The parsed Starter object.
     :rtype: Starter
     """
-    loaded = yaml.safe_load(starterfile_stream)
-
-    if "env_file" in loaded.keys():
-        if type(loaded["env_file"]) is list:
-            for env_file in loaded["env_file"]:
-                _path = os.path.join(os.path.dirname(starterfile_stream.name), env_file)
-                load_dotenv(str(_path))
-        elif type(loaded["env_file"]) is str:
-            _path = os.path.join(
-                os.path.dirname(starterfile_stream.name), loaded["env_file"]
-            )
-            load_dotenv(str(_path))
-
-    Starter.starterfile_schema.validate(loaded)
+    loaded, validated, cache_entry = _load_starterfile(starterfile_stream)
+    digest = None
+    if validate == "auto":
+        # Contents that were loaded without their validation being cached may still have passed it in this process
+        if not validated:
+            digest = _starterfile_digest(loaded)
+            validated = digest is not None and digest in _VALIDATED_STARTERFILES
+        validate = not validated
+
+    # Env files are relative to the directory containing the Starterfile
+    env_files = loaded.get("env_file")
+    if type(env_files) is str:
+        env_files = [env_files]
+    if type(env_files) is list:
+        starterfile_dir = os.path.dirname(starterfile_stream.name)
+        for env_file in env_files:
+            load_env_file(os.path.join(starterfile_dir, env_file))
+
+    if validate:
+        Starter.starterfile_schema.validate(loaded)
 
     tools = []
 
     for tool_name in loaded["tools"]:
-        _tool = loaded["tools"][tool_name]
-        tool = Tool.tool_schema.validate(_tool)
+        tool = loaded["tools"][tool_name]
 
-        dependencies = tool["depends_on"] if "depends_on" in _tool else None
-        mode = tool["mode"] if "mode" in _tool else "INSTALL"
-        alt = tool["alt"] if "alt" in _tool else None
+        dependencies = tool.get("depends_on")
+        mode = tool.get("mode", "INSTALL")
+        alt = tool.get("alt")
 
         if type(dependencies) is str:
             dependencies = [dependencies]
 
+        # The alt is a dependency as well, without modifying the loaded contents (which may be cached)
         if alt is not None:
-            dependencies.append(alt)
+            dependencies = [*(dependencies or ()), alt]
 
         tools.append(Tool(tool_name, dependencies, tool["scripts"], alt, mode))
 
@@ -555,26 +1071,22 @@ def parse_starterfile(starterfile_stream: TextIO) -> Starter:
     modules = []
 
     for module_name in loaded["modules"]:
-        _module = loaded["modules"][module_name]
-        module = Module.module_schema.validate(_module)
-
-        modules.append(create_module(module, module_name))
+        modules.append(create_module(loaded["modules"][module_name], module_name))
 
     module_dependencies = create_dependency_layers(modules)
 
     print("SUCCESS! Parsed modules:", [module.get_name() for module in modules])
 
-    env_replacement_targets = (
-        loaded["env_replace"] if "env_replace" in loaded.keys() else None
-    )
-    if "env_dump" in loaded.keys():
-        env_dump_file, env_dump_mode = (
-            loaded["env_dump"]["target"],
-            loaded["env_dump"]["mode"],
-        )
-        env_dump = (env_dump_file, env_dump_mode)
-    else:
-        env_dump = None
+    # Remember that these contents passed validation, so that it can be skipped while they are unchanged
+    if validate and not validated and cache_entry is not None:
+        _write_starterfile_cache(cache_entry, loaded, validated=True)
+    if validate and digest is not None:
+        _VALIDATED_STARTERFILES.add(digest)
+
+    env_replacement_targets = loaded.get("env_replace")
+    env_dump = loaded.get("env_dump")
+    if env_dump is not None:
+        env_dump = (env_dump["target"], env_dump["mode"])
 
     return Starter(
         modules=modules,
@@ -1,7 +1,9 @@
+from __future__ import annotations
+
 from enum import Enum
 from typing import List, Dict, Tuple
 
-from schema import Schema, And, Or, Optional
+from schema import Schema, Or, Optional
 
 from startout.util import (
     run_script_with_env_substitution,
@@ -22,6 +24,14 @@ class InstallationStatus(Enum):
     NOT_INSTALLED = 2
 
 
+# The scripts of a Tool, given at the top level and optionally overridden for each platform
+_TOOL_SCRIPTS_SCHEMA = {
+    Optional("install"): str,
+    Optional("uninstall"): str,
+    Optional("check"): str,
+}
+
+
 def should_rollback(installation_status: InstallationStatus):
     return installation_status == InstallationStatus.NEWLY_INSTALLED
 
@@ -59,29 +69,26 @@ class Tool:
             Returns True if the return code is 0, else False.
     """
 
+    __slots__ = (
+        "name",
+        "dependencies",
+        "scripts",
+        "alt",
+        "mode",
+        "status",
+        "_resolved_scripts",
+    )
+
+    # The fields that make up a Tool, compared by __eq__ (unlike the memo of resolved scripts, which grows on use)
+    _fields = ("name", "dependencies", "scripts", "alt", "mode", "status")
+
     tool_scripts_schema = Schema(
-        Or(
-            {
-                Optional("install"): And(str),
-                Optional("uninstall"): And(str),
-                Optional("check"): And(str),
-                Optional("windows"): {
-                    Optional("install"): And(str),
-                    Optional("uninstall"): And(str),
-                    Optional("check"): And(str),
-                },
-                Optional("mac"): {
-                    Optional("install"): And(str),
-                    Optional("uninstall"): And(str),
-                    Optional("check"): And(str),
-                },
-                Optional("linux"): {
-                    Optional("install"): And(str),
-                    Optional("uninstall"): And(str),
-                    Optional("check"): And(str),
-                },
-            },
-        )
+        {
+            **_TOOL_SCRIPTS_SCHEMA,
+            Optional("windows"): _TOOL_SCRIPTS_SCHEMA,
+            Optional("mac"): _TOOL_SCRIPTS_SCHEMA,
+            Optional("linux"): _TOOL_SCRIPTS_SCHEMA,
+        }
     )
     tool_schema = Schema(
         {
@@ -95,27 +102,28 @@ class Tool:
     def __init__(
         self,
         name: str,
-        dependencies: List[str] or None,
-        scripts: Dict[str, str or Dict[str, str]],
-        alt: str or None = None,
+        dependencies: List[str] | None,
+        scripts: Dict[str, str | Dict[str, str]],
+        alt: str | None = None,
         install_mode: str = "INSTALL",
     ):
         """
         Initializes a Tool with the given name, dependencies, and scripts.
 
         :param name: The name of the tool.
-        :param dependencies: A list of dependencies required by the tool.
+        :param dependencies: A list of dependencies required by the tool, stored as a frozenset.
         :param scripts: A dictionary mapping script names to their respective commands or scripts.
 
         :raises TypeError: If the 'install' and 'uninstall' scripts are not defined for the module.
         """
-        # These calls will raise ValueError if any are missing
-        get_script("install", scripts, name=name)
-        get_script("uninstall", scripts, name=name)
-        get_script("check", scripts, name=name)
+        # Resolve each script for this platform once, these calls will raise TypeError if any are missing
+        self._resolved_scripts = {
+            script: get_script(script, scripts, name=name)
+            for script in ("install", "uninstall", "check")
+        }
 
         self.name = name
-        self.dependencies = dependencies
+        self.dependencies = None if dependencies is None else frozenset(dependencies)
         self.scripts = scripts
         self.alt = alt
 
@@ -124,21 +132,27 @@ class Tool:
         self.status = InstallationStatus.NOT_INSTALLED
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+        return isinstance(other, self.__class__) and all(
+            getattr(self, attr) == getattr(other, attr) for attr in Tool._fields
+        )
 
     def __hash__(self):
-        return hash((self.name, str(self.dependencies), str(self.scripts)))
+        return hash((self.name, self.dependencies, str(self.scripts)))
 
-    def run(self, script: str) -> Tuple[str, int]:
+    def run(self, script: str, capture_output: bool = True) -> Tuple[str, int]:
         """
         Runs a script with environment variable substitutions.
 
         :param script: The name of the script to be executed, located in the Tool's scripts.
+        :param capture_output: Whether to collect the output of the script, if False it is discarded.
         :return: A tuple containing the stdout output and the return code of the script execution.
         """
-        _script = get_script(script, self.scripts, self.name)
+        _script = self._resolved_scripts.get(script)
+        if _script is None:
+            _script = get_script(script, self.scripts, self.name)
+            self._resolved_scripts[script] = _script
 
-        return run_script_with_env_substitution(_script)
+        return run_script_with_env_substitution(_script, capture_output=capture_output)
 
     def check(self):
         """
@@ -146,7 +160,8 @@ class Tool:
 
         :return: True if the response code is 0, False otherwise.
         """
-        response, code = self.run("check")
+        # Only the return code of the check is needed
+        _, code = self.run("check", capture_output=False)
 
         return code == 0
 
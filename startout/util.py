@@ -1,23 +1,23 @@
+from __future__ import annotations
+
+import functools
 import math
 import os
-import platform
 import re
 import shlex
 import shutil
 import subprocess
 import sys
-from collections import deque
-from io import TextIOWrapper
+from collections import Counter, deque
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, FrozenSet, Tuple, TYPE_CHECKING
 
-import click
-import rich
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
 from schema import SchemaError
 
+# Rich (and click) are only needed to display monitored output, so they are imported when it is first used
+if TYPE_CHECKING:
+    from rich.console import Console
+
 
 class MonitorOutput:
     def __init__(self, title: str, subtitle: str, console: Console, log_path: Path):
@@ -27,34 +27,46 @@ class MonitorOutput:
         self.log_path = log_path
 
 
-SENSITIVE_PATTERNS = [
-    re.compile(r"API_KEY", re.IGNORECASE),
-    re.compile(r"TOKEN", re.IGNORECASE),
-    re.compile(r"PASSWORD", re.IGNORECASE),
-    re.compile(r"SECRET", re.IGNORECASE),
-    re.compile(r"PRIVATE_KEY", re.IGNORECASE),
-    re.compile(r"ACCESS_KEY", re.IGNORECASE),
-]
+# Key names which suggest a sensitive value, combined so that each key is scanned once
+SENSITIVE_PATTERN = re.compile(
+    r"API_KEY|TOKEN|PASSWORD|SECRET|PRIVATE_KEY|ACCESS_KEY", re.IGNORECASE
+)
 
 HIGH_ENTROPY_THRESHOLD = 3.5
+# The entropy of a value is at most log2 of its length, so shorter values can never exceed the threshold
+MIN_HIGH_ENTROPY_LENGTH = math.floor(2**HIGH_ENTROPY_THRESHOLD) + 1
+
+# The host platform cannot change while the process is running, sys.platform is fixed when Python is built
+_IS_WINDOWS = sys.platform == "win32"
+_IS_MACOS = sys.platform == "darwin"
+# The key of the platform-specific scripts that apply to this platform
+_PLATFORM_KEY = "windows" if _IS_WINDOWS else "mac" if _IS_MACOS else "linux"
+
+# A negated class rather than a lazy ".+?", so that matching a name never backtracks
+ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
 
 def calculate_entropy(data):
     if not data:
         return 0
+    # Count every symbol in a single pass, rather than scanning the data once per distinct symbol
+    length = len(data)
     entropy = 0
-    for x in set(data):
-        p_x = data.count(x) / len(data)
-        entropy += -p_x * math.log2(p_x)
+    for count in Counter(data).values():
+        p_x = count / length
+        entropy -= p_x * math.log2(p_x)
     return entropy
 
 
 def is_potentially_sensitive_key_value(key, value):
     # Check if key matches sensitive patterns
-    if any(pattern.search(key) for pattern in SENSITIVE_PATTERNS):
+    if SENSITIVE_PATTERN.search(key):
         return True
-    # Check if value has high entropy
-    if calculate_entropy(value) > HIGH_ENTROPY_THRESHOLD:
+    # Check if value has high entropy, skipping values too short to reach the threshold
+    if (
+        len(value) >= MIN_HIGH_ENTROPY_LENGTH
+        and calculate_entropy(value) > HIGH_ENTROPY_THRESHOLD
+    ):
         return True
     return False
 
@@ -72,6 +84,17 @@ def is_yaml_loadable_type(value):
     return value
 
 
+# Lexicons of the boolean conversions below
+_BOOL_TO_YN = {True: "y", False: "n"}
+_TRUE_STRINGS = frozenset(("yes", "y", "true"))
+_FALSE_STRINGS = frozenset(("no", "n", "false"))
+_BOOL_TO_STRINGS = {True: _TRUE_STRINGS, False: _FALSE_STRINGS}
+_STRING_TO_BOOL = {
+    **dict.fromkeys(_TRUE_STRINGS, True),
+    **dict.fromkeys(_FALSE_STRINGS, False),
+}
+
+
 def bool_to_yn(bool_input: bool) -> str:
     """
     Converts a boolean value to a 'y' or 'n' string representation.
@@ -84,17 +107,16 @@ def bool_to_yn(bool_input: bool) -> str:
         - 'n' if bool_input is False
 
     """
-    lex = {True: "y", False: "n"}
+    return _BOOL_TO_YN[bool_input]
 
-    return lex[bool_input]
 
-
-def bool_to_strings(bool_input: bool) -> List[str]:
+def bool_to_strings(bool_input: bool) -> FrozenSet[str]:
     """
-    Converts a boolean value to a list of corresponding strings.
+    Converts a boolean value to the set of corresponding strings.
 
     :param bool_input: The boolean value to be converted.
-    :return: A list of strings representing the boolean value. The list will contain one or more of the following strings:
+    :return: A shared, immutable set of strings representing the boolean value, for membership tests. The set will
+        contain the following strings:
         - "yes"
         - "y"
         - "true" (if bool_input is True)
@@ -102,15 +124,10 @@ def bool_to_strings(bool_input: bool) -> List[str]:
         - "n"
         - "false" (if bool_input is False)
     """
-    lex = {
-        True: ["yes", "y", "true"],
-        False: ["no", "n", "false"],
-    }
+    return _BOOL_TO_STRINGS[bool_input]
 
-    return lex[bool_input]
 
-
-def string_to_bool(string_input: str) -> bool or None:
+def string_to_bool(string_input: str) -> bool | None:
     """
     Convert a string representation of boolean to a boolean value.
 
@@ -119,60 +136,37 @@ def string_to_bool(string_input: str) -> bool or None:
     :return: The corresponding boolean value or None if the input string is not recognized as boolean.
     :rtype: bool or None
     """
-    lex = {
-        "yes": True,
-        "y": True,
-        "true": True,
-        "no": False,
-        "n": False,
-        "false": False,
-    }
+    return _STRING_TO_BOOL.get(string_input.lower(), None)
 
-    return lex.get(string_input.lower(), None)
 
-
-def get_script(script: str, scripts_dict: Dict[str, str], name: str) -> str or None:
+def get_script(script: str, scripts_dict: Dict[str, str], name: str) -> str | None:
     """
     Get the script based on the platform and provided parameters.
 
     :param script: The name of the script to retrieve.
     :param scripts_dict: A dictionary containing the scripts for different platforms.
     :param name: The name of the tool.
-    :return: The script for the given platform and script name, or None if not found.
-    :raises ValueError: If the tool does not have the specified script in any platform.
+    :return: The script for the given platform and script name.
+    :raises TypeError: If the tool does not have the specified script in any platform.
     """
-    _os = platform.system().lower()
-    windows = _os in ["windows", "win32"]
-    macos = _os in ["darwin"]
-
-    _script = None
-
     # Default to top-level definition of the script (not platform-dependent)
-    if script in scripts_dict:
-        _script = scripts_dict[script]
+    _script = scripts_dict.get(script)
 
     # Any platform-dependent scripts will override the top-level definition
-    if type(scripts_dict) is dict:
-        if windows and "windows" in scripts_dict.keys():
-            if script in scripts_dict["windows"]:
-                _script = scripts_dict["windows"][script]
-        elif macos and "mac" in scripts_dict.keys():
-            if script in scripts_dict["mac"]:
-                _script = scripts_dict["mac"][script]
-        elif (not windows and not macos) and "linux" in scripts_dict.keys():
-            if script in scripts_dict["linux"]:
-                _script = scripts_dict["linux"][script]
+    platform_scripts = scripts_dict.get(_PLATFORM_KEY)
+    if platform_scripts:
+        _script = platform_scripts.get(script, _script)
 
     if _script is None:
         raise TypeError(
             f"Tool \"{name}\" does not have script '{script}' "
-            f"in {list(scripts_dict.keys())}"
+            f"in {list(scripts_dict)}"
         )
 
     return _script
 
 
-def type_tool(type_str: str) -> type or None:
+def type_tool(type_str: str) -> type | None:
     """
     Return the corresponding Python type based on the input string.
 
@@ -198,29 +192,133 @@ def replace_env(string: str) -> str:
     :return: The string with all environment variable placeholders replaced with their corresponding values.
 
     This method takes a string as input and replaces all occurrences of environment variable placeholders in the
-    format ${variable_name} with their corresponding values. It uses regular expressions to find all placeholders
-    in the string, then checks if the corresponding environment variable is set. If the variable is set, it replaces
-    the placeholder with the variable's value. If the variable is not set, it does not do any replacement and returns
-    the string unchanged.
+    format ${variable_name} with their corresponding values in a single regular expression substitution pass. If the
+    variable is set, it replaces the placeholder with the variable's value. If the variable is not set, the placeholder
+    is left unchanged. Substituted values are not scanned again, so a value which itself contains a placeholder is
+    inserted as-is.
 
     Example usage:
 
     >>> replace_env("Hello ${USERNAME}, your home directory is ${HOME}")
     'Hello John, your home directory is /home/john'
     """
-    pattern = re.compile(r"\$\{(.+?)}")
-    matches = pattern.findall(string)
+    return ENV_VAR_PATTERN.sub(
+        lambda match: os.environ.get(match.group(1), match.group(0)), string
+    )
+
+
+# Output redirection for scripts whose output is not needed, e.g. checks which only report through their return code
+_DISCARD_OUTPUT = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+
+
+@functools.lru_cache(maxsize=512)
+def _which(executable: str) -> str | None:
+    """
+    Cached :func:`shutil.which`, so that layered installs sharing a command don't each walk the PATH.
+
+    :param executable: The name of the command to locate.
+    :return: The path of the command, or None if it is not on the PATH.
+    """
+    return shutil.which(executable)
+
 
-    for match in matches:
-        env_value = os.getenv(match)
-        if env_value is not None:
-            string = string.replace(f"${{{match}}}", env_value)
+@functools.lru_cache(maxsize=256)
+def _split_script(script: str) -> Tuple[str, ...]:
+    """
+    Cached :func:`shlex.split`, so that scripts run more than once (e.g. checks) are only tokenized once.
+
+    :param script: The script to split, after environment variable substitution.
+    :return: The tokens of the script.
+    """
+    return tuple(shlex.split(script))
+
+
+def _launch_script(
+    _script: List[str],
+    substituted_script: str,
+    executable: str | None,
+    multiline: bool,
+    verbose: bool,
+    monitor_output: MonitorOutput | None,
+    capture_output: bool,
+    output_args: dict,
+):
+    """
+    Launch a script for `run_script_with_env_substitution`, directly if its command was found on the PATH and it is a
+    single line, otherwise in the shell.
+
+    :param _script: The tokens of the script.
+    :param substituted_script: The script after environment variable substitution.
+    :param executable: The path of the command of the script, or None if it was not found.
+    :param multiline: Whether the script has more than one line.
+    :param verbose: Whether to print a warning if the script is run in the shell because its command was not found.
+    :param monitor_output: Options for running the script with monitored output
+    :param capture_output: Whether the output of the script is collected.
+    :param output_args: The arguments of subprocess.run that collect or discard the output of the script.
+    :return: The completed process.
+    """
+    # If shutil can't find the command or the script is multiline, run as shell
+    if executable is None or multiline:
+        if executable is None and verbose:
+            print(
+                f"'{_script[0]}' is not installed. Trying script in shell.",
+                file=sys.stderr,
+            )
+
+        if _IS_WINDOWS:
+            windows_shell = "pwsh" if _which("pwsh") is not None else "powershell"
+            cmd = [windows_shell, "-Command", substituted_script]
+
+            if monitor_output is None:
+                result = subprocess.run(cmd, **({} if capture_output else output_args))
+            else:
+                result = monitored_subprocess(
+                    command=cmd,
+                    title=monitor_output.title,
+                    subtitle=monitor_output.subtitle,
+                    console=monitor_output.console,
+                )
+        else:
+            if monitor_output is None:
+                result = subprocess.run(
+                    substituted_script, shell=True, text=True, **output_args
+                )
+            else:
+                result = monitored_subprocess(
+                    command=substituted_script,
+                    title=monitor_output.title,
+                    subtitle=monitor_output.subtitle,
+                    console=monitor_output.console,
+                    shell=True,
+                )
+    # Else, run the shlex'd cmd list
+    else:
+        if monitor_output is None:
+            # Passing the resolved path and keeping inherited fds (Python's own are non-inheritable) lets
+            #  subprocess launch the command with posix_spawn instead of fork + exec
+            result = subprocess.run(
+                _script,
+                executable=executable,
+                close_fds=False,
+                text=True,
+                **output_args,
+            )
+        else:
+            result = monitored_subprocess(
+                command=_script,
+                title=monitor_output.title,
+                subtitle=monitor_output.subtitle,
+                console=monitor_output.console,
+            )
 
-    return string
+    return result
 
 
 def run_script_with_env_substitution(
-    script_str: str, verbose: bool = False, monitor_output: MonitorOutput or None = None
+    script_str: str,
+    verbose: bool = False,
+    monitor_output: MonitorOutput | None = None,
+    capture_output: bool = True,
 ) -> Tuple[str, int]:
     """
     Run a script with environment variable substitution. If the script fails to run as a shlex'd list, run it as a
@@ -229,87 +327,88 @@ def run_script_with_env_substitution(
     :param monitor_output: Options for running the script with monitored output
     :param verbose: Whether to print warning if the script fails to run as a shlex'd list or not.
     :param script_str: The script to be executed as a string.
-    :return: A tuple containing the stdout output and the return code of the script.
+    :param capture_output: Whether the output of the script is needed. If False, it is discarded instead of being
+        collected (ignored with monitored output).
+    :return: A tuple containing the stdout output (empty if not captured) and the return code of the script.
     """
+    output_args = {"capture_output": True} if capture_output else _DISCARD_OUTPUT
 
     # Inject environment variables
     substituted_script = replace_env(script_str)
     multiline = "\n" in substituted_script
 
-    _script = shlex.split(substituted_script)
+    _script = list(_split_script(substituted_script))
 
     try:
-        # If shutil can't find the command or the script is multiline, run as shell
-        if shutil.which(_script[0]) is None or multiline:
-            if shutil.which(_script[0]) is None and verbose:
-                print(
-                    f"'{_script[0]}' is not installed. Trying script in shell.",
-                    file=sys.stderr,
-                )
-
-            _os = platform.system().lower()
-            windows = _os in ["windows", "win32"]
-
-            if windows:
-                windows_shell = (
-                    "pwsh" if shutil.which("pwsh") is not None else "powershell"
-                )
-                cmd = [windows_shell, "-Command", substituted_script]
-
-                if monitor_output is None:
-                    result = subprocess.run(cmd)
-                else:
-                    result = monitored_subprocess(
-                        command=cmd,
-                        title=monitor_output.title,
-                        subtitle=monitor_output.subtitle,
-                        console=monitor_output.console,
-                    )
-            else:
-                if monitor_output is None:
-                    result = subprocess.run(
-                        substituted_script, shell=True, text=True, capture_output=True
-                    )
-                else:
-                    result = monitored_subprocess(
-                        command=substituted_script,
-                        title=monitor_output.title,
-                        subtitle=monitor_output.subtitle,
-                        console=monitor_output.console,
-                        shell=True,
-                    )
-        # Else, run the shlex'd cmd list
-        else:
-            if monitor_output is None:
-                result = subprocess.run(_script, text=True, capture_output=True)
-            else:
-                result = monitored_subprocess(
-                    command=_script,
-                    title=monitor_output.title,
-                    subtitle=monitor_output.subtitle,
-                    console=monitor_output.console,
-                )
+        executable = _which(_script[0])
+        try:
+            result = _launch_script(
+                _script,
+                substituted_script,
+                executable,
+                multiline,
+                verbose,
+                monitor_output,
+                capture_output,
+                output_args,
+            )
+        except FileNotFoundError:
+            if executable is None or multiline:
+                raise
+
+            # The cached PATH lookup is stale (e.g. the command was moved or uninstalled during this run), so look the
+            #  command up again, running the script in the shell if it is gone
+            _which.cache_clear()
+            result = _launch_script(
+                _script,
+                substituted_script,
+                _which(_script[0]),
+                multiline,
+                verbose,
+                monitor_output,
+                capture_output,
+                output_args,
+            )
     except subprocess.CalledProcessError as e:
         return f"{e.stderr.strip()}", e.returncode
 
-    if isinstance(result.stdout, TextIOWrapper):
-        result.stdout = result.stdout.read()
+    if monitor_output is None and not capture_output:
+        return "", result.returncode
 
-    return str(result.stdout), result.returncode
+    # Output is captured as text (or joined by monitored_subprocess), except in PowerShell where it is not captured
+    return "" if result.stdout is None else result.stdout, result.returncode
 
 
 # Code snippet used with permission @Hubro https://github.com/Textualize/rich/discussions/2885#discussioncomment-5382390
 def monitored_subprocess(
-    command: List[str] or str,
-    title: str or None,
-    subtitle: str or None,
+    command: List[str] | str,
+    title: str | None,
+    subtitle: str | None,
     console: Console,
     shell: bool = False,
 ):
     """
     Run a subprocess while displaying the output in a temporary box with Rich
     """
-    stdout_output = ""
+    import click
+
+    # Without a terminal (e.g. output piped to a CI log) there is nothing to redraw, so just run the command
+    if not console.is_terminal:
+        try:
+            return subprocess.run(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                encoding="UTF-8",
+                shell=shell,
+            )
+        except KeyboardInterrupt:
+            raise click.Abort()
+
+    from rich.live import Live
+    from rich.panel import Panel
+
+    stdout_lines = []
 
     box_height = min(max([console.height // 4, 6]), 12)
     box_inner_height = box_height - 2  # The panel has 1 row of padding on each side
@@ -322,23 +421,24 @@ def monitored_subprocess(
             "\n".join(buffer), height=box_height, title=title, subtitle=subtitle
         )
 
-    with rich.live.Live(
-        get_renderable=process_panel, refresh_per_second=30, transient=True
-    ):
+    with Live(get_renderable=process_panel, refresh_per_second=30, transient=True):
         process = subprocess.Popen(
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             encoding="UTF-8",
             shell=shell,
+            # A larger pipe buffer means fewer reads for scripts with a lot of output
+            bufsize=1 << 16,
         )
 
         assert process.stdout
 
         try:
             for line in process.stdout:
+                # The raw line is kept for the output, only the displayed line is trimmed
+                stdout_lines.append(line)
                 buffer.append(line[:box_width].rstrip())
-                stdout_output += line
         except KeyboardInterrupt:
             process.terminate()
             raise click.Abort()
@@ -351,7 +451,7 @@ def monitored_subprocess(
         completed_process = subprocess.CompletedProcess(
             args=command,
             returncode=process.returncode,
-            stdout=stdout_output,
+            stdout="".join(stdout_lines),
             stderr=process.stderr,
         )
 
@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+import pytest
+
+import startout.starterfile
+
+
+@pytest.fixture(autouse=True)
+def starterfile_cache_dir(tmp_path, monkeypatch):
+    """
+    Keep the Starterfile cache of every test in its own temporary directory, rather than the cache of the user.
+    """
+    cache_dir = tmp_path / "starterfile_cache"
+    monkeypatch.setattr(startout.starterfile, "STARTERFILE_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture
+def module_kwargs():
+    """
+    Arguments of a Module that initializes successfully, shared by the tests of each type of Module. They are built
+    again for every test, as the Module keeps its scripts and init options without copying them.
+    """
+    return {
+        "name": "successfully_initialized_module",
+        "dest": "/path/to/dest",
+        "source": "git",
+        "scripts": {"init": "exit 0", "destroy": "exit 0"},
+        "dependencies": ["dependency1", "dependency2"],
+        "init_options": [
+            {
+                "env_name": "test",
+                "type": "str",
+                "default": "default_val",
+                "prompt": "prompt_msg",
+            }
+        ],
+    }
+
+
+@pytest.fixture(scope="class")
+def path_params(request):
+    """
+    Set the parameters shared by the tests of initializing a Path on the test class, once for the class rather than in
+    the setUp of every test.
+    """
+    request.cls.fully_formed_template_name = "Github/Repository"
+    request.cls.startout_path_template_name = "test-test"
+    request.cls.new_repo_name = "NewRepo"
+    request.cls.new_repo_owner = "Owner"
+    request.cls.public = True
+    request.cls.created_repo_path = "path/to/repo"
+
+
+@pytest.fixture(scope="class")
+def _autospecced_paths_console(request):
+    # Autospeccing the console is slow, so it is done once for each test class
+    with patch("startout.paths.console", autospec=True) as mock_console:
+        request.cls.mock_console = mock_console
+        yield mock_console
+
+
+@pytest.fixture
+def paths_console(_autospecced_paths_console):
+    """
+    Patch the console of startout.paths with an autospecced mock, shared by the tests of a class as `self.mock_console`
+    and reset before each test.
+    """
+    _autospecced_paths_console.reset_mock(side_effect=True)
+    # On Python 3.8 reset_mock does not pass its arguments on to child mocks, so the prompts are reset explicitly
+    _autospecced_paths_console.input.reset_mock(return_value=True, side_effect=True)
+    return _autospecced_paths_console
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip the slow tests unless they are selected with a marker expression, e.g. `pytest -m slow` or
+    `pytest -m "slow or not slow"` for the whole suite.
+    """
+    if config.getoption("markexpr"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test, select with -m slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
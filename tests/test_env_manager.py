@@ -1,5 +1,4 @@
 import os
-from typing import Tuple
 from unittest.mock import patch
 import pytest
 from startout.env_manager import EnvironmentVariableManager
@@ -1,4 +1,5 @@
 import json
+import subprocess
 from unittest import mock
 
 import pytest
@@ -6,87 +7,70 @@ import pytest
 from startout.github_api import check_repo_custom_property
 from startout.github_api import create_repo_from_temp
 
-
-class MockCompleteProcess:
-    def __init__(self, returncode: int, stdout: str, stderr: str):
-        self.returncode = returncode
-        self.stdout = stdout.encode("utf-8")
-        self.stderr = stderr.encode("utf-8")
+# Responses of `gh api`, built once for every test that uses them
+_PROPERTIES_STDOUT = json.dumps(
+    [
+        {"property_name": "test_property", "value": "test_value"},
+    ]
+).encode()
+_ERROR_STDOUT = b"Sample error message"
+_BAD_JSON_STDOUT = b"bad json"
 
 
 @mock.patch("subprocess.run")
 def test_create_repo_from_temp_success(mock_subprocess):
-    mock_subprocess.return_value = MockCompleteProcess(0, "", "")
+    mock_subprocess.return_value = subprocess.CompletedProcess([], 0, stdout=b"")
 
     response = create_repo_from_temp("owner", "repo_name", "template-repo")
     assert response.endswith("repo_name")
+    assert mock_subprocess.call_args.args[0] == [
+        "gh",
+        "repo",
+        "create",
+        "owner/repo_name",
+        "--template=template-repo",
+        "--clone",
+        "--private",
+    ]
 
 
 @mock.patch("subprocess.run")
 def test_create_repo_from_temp_failure(mock_subprocess):
-    mock_subprocess.return_value = MockCompleteProcess(1, "", "")
+    mock_subprocess.return_value = subprocess.CompletedProcess([], 1, stdout=b"")
 
     response = create_repo_from_temp("owner", "repo_name", "template-repo", True)
     assert response is False
+    assert mock_subprocess.call_args.args[0][-1] == "--public"
 
 
 @pytest.fixture
 def subprocess_run_success():
     with mock.patch("subprocess.run") as m:
         m.return_value.returncode = 0
-        m.return_value.stdout = json.dumps(
-            [
-                {"property_name": "test_property", "value": "test_value"},
-            ]
-        ).encode()
+        m.return_value.stdout = _PROPERTIES_STDOUT
         yield m
 
 
-@pytest.fixture
-def subprocess_run_failure():
-    with mock.patch("subprocess.run") as m:
-        m.return_value.returncode = 1
-        m.return_value.stdout = "Sample error message".encode()
-        yield m
-
-
-@pytest.mark.usefixtures("subprocess_run_success")
-def test_check_repo_custom_property_success():
-    template_owner = "owner"
-    template_name = "repo"
-    custom_properties = {"test_property": "test_value"}
-
-    assert (
-        check_repo_custom_property(template_owner, template_name, custom_properties)
-        is True
-    )
-
-
-@pytest.mark.usefixtures("subprocess_run_failure")
-def test_check_repo_custom_property_failure():
-    template_owner = "owner"
-    template_name = "repo"
-    custom_properties = {"test_property": "test_value"}
-
-    assert (
-        check_repo_custom_property(template_owner, template_name, custom_properties)
-        is False
-    )
-
-
-@pytest.mark.usefixtures("subprocess_run_success")
-def test_check_repo_custom_property_bad_json():
+@pytest.mark.parametrize(
+    "returncode, stdout, expected",
+    [
+        (0, _PROPERTIES_STDOUT, True),
+        (1, _ERROR_STDOUT, False),
+        (0, _BAD_JSON_STDOUT, False),
+    ],
+    ids=["success", "failure", "bad_json"],
+)
+def test_check_repo_custom_property(returncode, stdout, expected):
     template_owner = "owner"
     template_name = "repo"
     custom_properties = {"test_property": "test_value"}
 
     with mock.patch("subprocess.run") as m:
-        m.return_value.returncode = 0
-        m.return_value.stdout = "bad json".encode()
+        m.return_value = subprocess.CompletedProcess([], returncode, stdout=stdout)
 
         assert (
             check_repo_custom_property(template_owner, template_name, custom_properties)
-            is False
+            is expected
         )
 
 
@@ -1,12 +1,18 @@
-import os
 import unittest
+from pathlib import Path
 from unittest import mock
 from unittest.mock import patch
 
-from parameterized import parameterized
+import pytest
 
 import startout.paths
 
+pytestmark = pytest.mark.slow
+
+COMPLEX_STARTER_WORKSPACE = (
+    Path(__file__).parent / "resources" / "workspaces" / "complex_starter"
+)
+
 
 # @mock.patch('startout.paths.prompt_init_option')
 # @mock.patch('startout.paths.parse_starterfile')
@@ -16,29 +22,19 @@ import startout.paths
 # @mock.patch('startout.paths.new_repo_owner_interactive')
 # @mock.patch('startout.paths.gh_api.check_repo_custom_property')
 # @mock.patch('startout.paths.re.match')
+@pytest.mark.usefixtures("path_params", "paths_console")
 class TestStarterFileCLIEndToEnd(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _monkeypatch(self, monkeypatch):
+        # Changes to the working directory are undone by monkeypatch after each test
+        self.monkeypatch = monkeypatch
 
     def setUp(self):
-        self.safe_dir = os.getcwd()
-
-        # Test parameters
-        self.fully_formed_template_name = "Github/Repository"
-        self.startout_path_template_name = "test-test"
-        self.new_repo_name = "NewRepo"
-        self.new_repo_owner = "Owner"
-        self.public = True
-        self.created_repo_path = "path/to/repo"
-
-        self.console_patcher = patch("startout.paths.console", autospec=True)
-        self.mock_console = self.console_patcher.start()
-
         self.console_height_patcher = patch("startout.paths.console.height", new=4)
         self.console_height_patcher.start()
 
     def tearDown(self):
-        self.console_patcher.stop()
         self.console_height_patcher.stop()
-        os.chdir(self.safe_dir)
 
     @mock.patch("startout.paths.initialize_repo")
     @mock.patch("startout.paths.gh_api.check_repo_custom_property")
@@ -57,6 +53,6 @@ class TestStarterFileCLIEndToEnd(unittest.TestCase):
         )  # Successfully initialized the repo
         #####################
 
-        os.chdir("tests/resources/workspaces/complex_starter")
+        self.monkeypatch.chdir(COMPLEX_STARTER_WORKSPACE)
 
         startout.paths.starterfile_up_only("complex_starter.yaml")
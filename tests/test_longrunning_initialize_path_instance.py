@@ -1,11 +1,23 @@
 import unittest
-from unittest import mock
 from unittest.mock import patch
 
+import pytest
+
 import startout.paths
 
+pytestmark = pytest.mark.slow
+
 
 class Starter:
+    __slots__ = (
+        "name",
+        "mock_init_options",
+        "mock_up_succeeds",
+        "env_replacement_targets",
+        "env_dump_file",
+        "env_dump_mode",
+    )
+
     def __init__(
         self, name, mock_init_options: list = None, mock_up_succeeds: bool = True
     ):
@@ -22,6 +34,9 @@ class Starter:
 
         return []
 
+    def iter_init_options(self):
+        return iter(self.get_init_options())
+
     def set_init_options(self, _):
         pass
 
@@ -30,58 +45,54 @@ class Starter:
 
 
 class InitOption:
+    __slots__ = ("name",)
+
     def __init__(self, name):
         self.name = name
 
 
-@mock.patch("startout.paths.prompt_init_option")
-@mock.patch("startout.paths.parse_starterfile")
-@mock.patch("startout.paths.open")
-@mock.patch("startout.paths.os.chdir")
-@mock.patch("startout.paths.initialize_repo")
-@mock.patch("startout.paths.new_repo_owner_interactive")
-@mock.patch("startout.paths.gh_api.check_repo_custom_property")
-@mock.patch("startout.paths.re.match")
+@pytest.mark.usefixtures("path_params", "paths_console")
 class TestInitializePathInstance(unittest.TestCase):
-
     def setUp(self):
-        # Test parameters
-        self.fully_formed_template_name = "Github/Repository"
-        self.startout_path_template_name = "test-test"
-        self.new_repo_name = "NewRepo"
-        self.new_repo_owner = "Owner"
-        self.public = True
-        self.created_repo_path = "path/to/repo"
-
-        self.console_patcher = patch("startout.paths.console", autospec=True)
-        self.mock_console = self.console_patcher.start()
+        # Whether the template is a fully formed reference is decided by a plain function rather than a MagicMock
+        self.match_result = False
+        self.match_calls = []
+
+        def match(pattern, string):
+            self.match_calls.append((pattern, string))
+            return self.match_result
+
+        match_patcher = patch("startout.paths.re.match", new=match)
+        match_patcher.start()
+        self.addCleanup(match_patcher.stop)
+
+        # Patch the collaborators of initialize_path_instance once for each test, rather than decorating every test
+        for name, target in (
+            ("mock_check", "startout.paths.gh_api.check_repo_custom_property"),
+            ("mock_new_owner", "startout.paths.new_repo_owner_interactive"),
+            ("mock_init_repo", "startout.paths.initialize_repo"),
+            ("mock_chdir", "startout.paths.os.chdir"),
+            ("mock_open", "startout.paths.open"),
+            ("mock_parse", "startout.paths.parse_starterfile"),
+            ("mock_prompt", "startout.paths.prompt_init_option"),
+        ):
+            patcher = patch(target)
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
 
         self.mock_starter_valid = Starter("MockStarter")
 
-    def tearDown(self):
-        self.console_patcher.stop()
-
-    def test_initialize_path_instance_fully_formed(
-        self,
-        mock_re,
-        mock_check,
-        mock_new_owner,
-        mock_init_repo,
-        mock_chdir,
-        mock_open,
-        mock_parse,
-        mock_prompt,
-    ):
+    def test_initialize_path_instance_fully_formed(self):
         #####################
         # Define interactions
-        mock_re.return_value = True
-        mock_check.return_value = True
-        mock_new_owner.return_value = "Owner"
-        mock_init_repo.return_value = True
-        mock_parse.side_effect = (
+        self.match_result = True
+        self.mock_check.return_value = True
+        self.mock_new_owner.return_value = "Owner"
+        self.mock_init_repo.return_value = True
+        self.mock_parse.side_effect = (
             lambda x: x
         )  # This function will simply return what it received
-        mock_prompt.side_effect = (
+        self.mock_prompt.side_effect = (
             lambda x: x
         )  # This function will simply return what it received
         #####################
@@ -93,24 +104,14 @@ class TestInitializePathInstance(unittest.TestCase):
             self.public,
         )
 
-        mock_re.assert_called_once_with(
-            r"^[^/]*/[^/]*$", self.fully_formed_template_name
+        self.assertEqual(
+            self.match_calls, [(r"^[^/]*/[^/]*$", self.fully_formed_template_name)]
         )
 
-    def test_initialize_path_instance_invalid_template(
-        self,
-        mock_re,
-        mock_check,
-        mock_new_owner,
-        mock_init_repo,
-        mock_chdir,
-        mock_open,
-        mock_parse,
-        mock_prompt,
-    ):
+    def test_initialize_path_instance_invalid_template(self):
         #####################
         # Define interactions
-        mock_re.return_value = False  # The template defined is not a valid reference
+        self.match_result = False  # The template defined is not a valid reference
         #####################
 
         with self.assertRaises(SystemExit):
@@ -121,28 +122,18 @@ class TestInitializePathInstance(unittest.TestCase):
                 self.public,
             )
 
-    def test_initialize_path_instance_startout_valid_path(
-        self,
-        mock_re,
-        mock_check,
-        mock_new_owner,
-        mock_init_repo,
-        mock_chdir,
-        mock_open,
-        mock_parse,
-        mock_prompt,
-    ):
+    def test_initialize_path_instance_startout_valid_path(self):
         #####################
         # Define interactions
         self.mock_console.input.side_effect = [
             ""
         ]  # Simulate pressing enter to take default
-        mock_re.return_value = False  # The template defined is not a valid reference
-        mock_check.return_value = True  # The template is a valid Path
-        mock_init_repo.return_value = (
+        self.match_result = False  # The template defined is not a valid reference
+        self.mock_check.return_value = True  # The template is a valid Path
+        self.mock_init_repo.return_value = (
             self.created_repo_path
         )  # Successfully initialized the repo
-        mock_parse.return_value = self.mock_starter_valid
+        self.mock_parse.return_value = self.mock_starter_valid
         #####################
 
         startout.paths.initialize_path_instance(
@@ -152,24 +143,14 @@ class TestInitializePathInstance(unittest.TestCase):
             self.public,
         )
 
-    def test_initialize_path_instance_non_startout_non_path(
-        self,
-        mock_re,
-        mock_check,
-        mock_new_owner,
-        mock_init_repo,
-        mock_chdir,
-        mock_open,
-        mock_parse,
-        mock_prompt,
-    ):
+    def test_initialize_path_instance_non_startout_non_path(self):
         #####################
         # Define interactions
         self.mock_console.input.side_effect = [
             "Not-Start-Out"
         ]  # Give a Non-StartOut owner
-        mock_re.return_value = False  # The template defined is not a valid reference
-        mock_check.return_value = False  # The template is NOT a valid Path
+        self.match_result = False  # The template defined is not a valid reference
+        self.mock_check.return_value = False  # The template is NOT a valid Path
         #####################
 
         startout.paths.initialize_path_instance(
@@ -180,32 +161,22 @@ class TestInitializePathInstance(unittest.TestCase):
         )
 
         # Assert that there was no attempt to parse a Starterfile
-        mock_chdir.assert_not_called()
-
-    def test_initialize_path_with_interactive_new_owner(
-        self,
-        mock_re,
-        mock_check,
-        mock_new_owner,
-        mock_init_repo,
-        mock_chdir,
-        mock_open,
-        mock_parse,
-        mock_prompt,
-    ):
+        self.mock_chdir.assert_not_called()
+
+    def test_initialize_path_with_interactive_new_owner(self):
         #####################
         # Define interactions
-        mock_re.return_value = True
-        mock_check.return_value = True
-        mock_init_repo.return_value = True
-        mock_parse.side_effect = (
+        self.match_result = True
+        self.mock_check.return_value = True
+        self.mock_init_repo.return_value = True
+        self.mock_parse.side_effect = (
             lambda x: x
         )  # This function will simply return what it received
-        mock_prompt.side_effect = (
+        self.mock_prompt.side_effect = (
             lambda x: x
         )  # This function will simply return what it received
 
-        mock_check.mock_new_owner = (
+        self.mock_check.mock_new_owner = (
             "goose"  # Simulate interactively prompting for the owner if not defined
         )
         #####################
@@ -215,24 +186,14 @@ class TestInitializePathInstance(unittest.TestCase):
         )
 
         # Assert that there was an attempt to parse a Starterfile
-        mock_chdir.assert_called()
-
-    def test_initialize_path_init_repo_fails(
-        self,
-        mock_re,
-        mock_check,
-        mock_new_owner,
-        mock_init_repo,
-        mock_chdir,
-        mock_open,
-        mock_parse,
-        mock_prompt,
-    ):
+        self.mock_chdir.assert_called()
+
+    def test_initialize_path_init_repo_fails(self):
         #####################
         # Define interactions
-        mock_re.return_value = True
-        mock_check.return_value = True
-        mock_init_repo.return_value = False
+        self.match_result = True
+        self.mock_check.return_value = True
+        self.mock_init_repo.return_value = False
         #####################
 
         # Assert that the program exits with a failure
@@ -241,25 +202,15 @@ class TestInitializePathInstance(unittest.TestCase):
                 "Valid/Enough", self.new_repo_name, self.new_repo_owner, self.public
             )
 
-    def test_initialize_path_init_options(
-        self,
-        mock_re,
-        mock_check,
-        mock_new_owner,
-        mock_init_repo,
-        mock_chdir,
-        mock_open,
-        mock_parse,
-        mock_prompt,
-    ):
+    def test_initialize_path_init_options(self):
         #####################
         # Define interactions
         self.mock_console.input.side_effect = [
             ""
         ]  # Simulate pressing enter to take default
-        mock_re.return_value = False  # The template defined is not a valid reference
-        mock_check.return_value = True  # The template is a valid Path
-        mock_init_repo.return_value = (
+        self.match_result = False  # The template defined is not a valid reference
+        self.mock_check.return_value = True  # The template is a valid Path
+        self.mock_init_repo.return_value = (
             self.created_repo_path
         )  # Successfully initialized the repo
 
@@ -267,9 +218,9 @@ class TestInitializePathInstance(unittest.TestCase):
         self.mock_starter_valid.mock_init_options = [
             ("module_name", [InitOption("init_option")])
         ]
-        mock_parse.return_value = self.mock_starter_valid
+        self.mock_parse.return_value = self.mock_starter_valid
 
-        mock_prompt.return_value = "option_value"
+        self.mock_prompt.return_value = "option_value"
         #####################
 
         startout.paths.initialize_path_instance(
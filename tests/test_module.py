@@ -5,13 +5,15 @@ from startout.module import Module, check_for_key
 
 
 class TestModuleInitializationSuccess(unittest.TestCase):
-    def setUp(self):
-        self.name = "successfully_initialized_module"
-        self.dest = "/path/to/dest"
-        self.source = "git"
-        self.scripts = {"init": "exit 0", "destroy": "exit 0"}
-        self.dependencies = ["dependency1", "dependency2"]
-        self.init_options = [
+    @classmethod
+    def setUpClass(cls):
+        # The Module is not modified by these tests, so it is only built once
+        cls.name = "successfully_initialized_module"
+        cls.dest = "/path/to/dest"
+        cls.source = "git"
+        cls.scripts = {"init": "exit 0", "destroy": "exit 0"}
+        cls.dependencies = ["dependency1", "dependency2"]
+        cls.init_options = [
             {
                 "env_name": "test",
                 "type": "str",
@@ -19,13 +21,13 @@ class TestModuleInitializationSuccess(unittest.TestCase):
                 "prompt": "prompt_msg",
             }
         ]
-        self.module = Module(
-            self.name,
-            self.dest,
-            self.source,
-            self.scripts,
-            self.dependencies,
-            self.init_options,
+        cls.module = Module(
+            cls.name,
+            cls.dest,
+            cls.source,
+            cls.scripts,
+            cls.dependencies,
+            cls.init_options,
         )
 
     def test_module_init_succeeds(self):
@@ -45,6 +47,12 @@ class TestModuleInitializationSuccess(unittest.TestCase):
         self.assertEqual(code, 0)
         self.assertTrue(isinstance(response, str))
 
+    def test_run_resolves_scripts_once(self):
+        with mock.patch("startout.module.get_script") as mock_get_script:
+            _, code = self.module.run("init")
+        self.assertEqual(code, 0)
+        mock_get_script.assert_not_called()
+
     def test_run_existing_script_with_output(self):
         # capture print output during method execution
         response, code = self.module.run("init", print_output=True)
@@ -1,24 +1,13 @@
+import subprocess
+
 import pytest
 from unittest import mock
 from startout import module
 
 
 @pytest.fixture
-def git_module():
-    name = "successfully_initialized_module"
-    dest = "/path/to/dest"
-    source = "git"
-    scripts = {"init": "exit 0", "destroy": "exit 0"}
-    dependencies = ["dependency1", "dependency2"]
-    init_options = [
-        {
-            "env_name": "test",
-            "type": "str",
-            "default": "default_val",
-            "prompt": "prompt_msg",
-        }
-    ]
-    return module.GitModule(name, dest, source, scripts, dependencies, init_options)
+def git_module(module_kwargs):
+    return module.GitModule(**module_kwargs)
 
 
 def test_GitModule_initialization_error(git_module):
@@ -30,42 +19,77 @@ def test_GitModule_initialization_error(git_module):
             git_module.initialize()
 
 
-def test_GitModule_initialization_fail_cloning(git_module):
+def test_GitModule_initialization_clone_output(git_module, capsys):
     git_module.source = "https://github.com/username/repo.git"
     git_module.dest = "/path/to/destination"
 
-    mocked_run = mock.Mock(return_value=mock.Mock(returncode=1))
-    patched_run = mock.patch("subprocess.run", new=mocked_run)
+    mocked_run = mock.Mock(
+        return_value=subprocess.CompletedProcess(
+            [], 128, stdout="fatal: repository not found\n"
+        )
+    )
 
-    with mock.patch("shutil.which", return_value="/usr/bin/git"), patched_run:
+    with mock.patch("shutil.which", return_value="/usr/bin/git"), mock.patch(
+        "subprocess.run", new=mocked_run
+    ):
         assert not git_module.initialize()
 
-
-def test_GitModule_initialization_fail_init_script(git_module):
+    mocked_run.assert_called_once_with(
+        ["git", "clone", git_module.source, git_module.dest],
+        stdout=mock.ANY,
+        stderr=mock.ANY,
+        text=True,
+    )
+    assert "fatal: repository not found" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "clone_returncode, init_result, expected",
+    [
+        (1, None, False),  # Cloning fails, so the init script is not run
+        (0, ("error message", 1), False),  # The init script fails
+        (0, ("success message", 0), True),
+    ],
+    ids=["fail_cloning", "fail_init_script", "success"],
+)
+def test_GitModule_initialization(git_module, clone_returncode, init_result, expected):
     git_module.source = "https://github.com/username/repo.git"
     git_module.dest = "/path/to/destination"
 
-    subprocess_run_mocked = mock.Mock()
-    subprocess_run_mocked.return_value.returncode = 0
-    run_mocked = mock.Mock()
-    run_mocked.return_value = ("error message", 1)
+    # A plain stand-in for subprocess.run, as only the calls of the Module's own run are inspected
+    completed_process = subprocess.CompletedProcess([], clone_returncode, stdout="")
+    subprocess_run_mocked = lambda *args, **kwargs: completed_process
+    run_mocked = mock.Mock(return_value=init_result)
 
     with mock.patch("shutil.which", return_value="/usr/bin/git"), mock.patch(
         "subprocess.run", new=subprocess_run_mocked
-    ), mock.patch.object(git_module, "run", new=run_mocked):
-        assert not git_module.initialize()
+    ), mock.patch.object(type(git_module), "run", new=run_mocked):
+        assert git_module.initialize() is expected
 
+    assert run_mocked.called is (clone_returncode == 0)
 
-def test_GitModule_initialization_success(git_module):
-    git_module.source = "https://github.com/username/repo.git"
-    git_module.dest = "/path/to/destination"
 
-    subprocess_run_mocked = mock.Mock()
-    subprocess_run_mocked.return_value.returncode = 0
-    run_mocked = mock.Mock()
-    run_mocked.return_value = ("success message", 0)
+def test_GitModule_equality(module_kwargs):
+    assert module.GitModule(**module_kwargs) == module.GitModule(**module_kwargs)
 
-    with mock.patch("shutil.which", return_value="/usr/bin/git"), mock.patch(
-        "subprocess.run", new=subprocess_run_mocked
-    ), mock.patch.object(git_module, "run", new=run_mocked):
-        assert git_module.initialize()
+    other = module.GitModule(
+        name="other_module",
+        dest="/other/dest",
+        source="https://github.com/username/other.git",
+        scripts={"init": "exit 1", "destroy": "exit 1"},
+    )
+    assert module.GitModule(**module_kwargs) != other
+
+
+def test_GitModule_equality_after_run(module_kwargs):
+    scripts = {"init": "exit 0", "destroy": "exit 0", "build": "exit 0"}
+    a = module.GitModule(**{**module_kwargs, "scripts": scripts})
+    b = module.GitModule(**{**module_kwargs, "scripts": scripts})
+
+    with mock.patch(
+        "startout.module.run_script_with_env_substitution", return_value=("", 0)
+    ):
+        a.run("build")
+
+    assert a == b
+    assert hash(a) == hash(b)
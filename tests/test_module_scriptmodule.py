@@ -1,24 +1,13 @@
+import subprocess
+
 import pytest
 from unittest import mock
 from startout import module
 
 
 @pytest.fixture
-def script_module():
-    name = "successfully_initialized_module"
-    dest = "/path/to/dest"
-    source = "script"
-    scripts = {"init": "exit 0", "destroy": "exit 0"}
-    dependencies = ["dependency1", "dependency2"]
-    init_options = [
-        {
-            "env_name": "test",
-            "type": "str",
-            "default": "default_val",
-            "prompt": "prompt_msg",
-        }
-    ]
-    return module.ScriptModule(name, dest, source, scripts, dependencies, init_options)
+def script_module(module_kwargs):
+    return module.ScriptModule(**{**module_kwargs, "source": "script"})
 
 
 def test_ScriptModule_initialization_error(script_module):
@@ -29,44 +18,29 @@ def test_ScriptModule_initialization_error(script_module):
         assert not script_module.initialize()
 
 
-def test_ScriptModule_initialization_fail_execution(script_module):
-    script_module.source = "/valid/script/path.sh"
-    script_module.dest = "/path/to/destination"
-
-    run_mocked = mock.Mock()
-    run_mocked.return_value = ("error message", 1)
-
-    with mock.patch("os.path.isfile", return_value=True), mock.patch.object(
-        script_module, "run", new=run_mocked
-    ):
-        assert not script_module.initialize()
-
-
-def test_ScriptModule_initialization_fail_init_script(script_module):
+@pytest.mark.parametrize(
+    "script_returncode, init_result, expected",
+    [
+        (1, None, False),  # The source script fails, so the init script is not run
+        (0, ("error message", 1), False),  # The init script fails
+        (0, ("success message", 0), True),
+    ],
+    ids=["fail_execution", "fail_init_script", "success"],
+)
+def test_ScriptModule_initialization(
+    script_module, script_returncode, init_result, expected
+):
     script_module.source = "/valid/script/path.sh"
     script_module.dest = "/path/to/destination"
 
-    subprocess_run_mocked = mock.Mock()
-    subprocess_run_mocked.return_value.returncode = 0
-    run_mocked = mock.Mock()
-    run_mocked.return_value = ("error message", 1)
+    # A plain stand-in for subprocess.run, as only the calls of the Module's own run are inspected
+    completed_process = subprocess.CompletedProcess([], script_returncode, stdout="")
+    subprocess_run_mocked = lambda *args, **kwargs: completed_process
+    run_mocked = mock.Mock(return_value=init_result)
 
     with mock.patch("os.path.isfile", return_value=True), mock.patch(
         "subprocess.run", new=subprocess_run_mocked
-    ), mock.patch.object(script_module, "run", new=run_mocked):
-        assert not script_module.initialize()
-
-
-def test_ScriptModule_initialization_success(script_module):
-    script_module.source = "/valid/script/path.sh"
-    script_module.dest = "/path/to/destination"
-
-    subprocess_run_mocked = mock.Mock()
-    subprocess_run_mocked.return_value.returncode = 0
-    run_mocked = mock.Mock()
-    run_mocked.return_value = ("success message", 0)
+    ), mock.patch.object(type(script_module), "run", new=run_mocked):
+        assert script_module.initialize() is expected
 
-    with mock.patch("os.path.isfile", return_value=True), mock.patch(
-        "subprocess.run", new=subprocess_run_mocked
-    ), mock.patch.object(script_module, "run", new=run_mocked):
-        assert script_module.initialize()
+    assert run_mocked.called is (script_returncode == 0)
@@ -1,42 +1,40 @@
 import pytest
 
-from startout.module import create_module, check_for_key, Module
-
-
-def test_check_for_key_top_level():
-    name = "test"
-    key = "init"
-    scripts = {"init": "some_value", "windows": {}, "mac": {}, "linux": {}}
-    # Expect no exception to be raised
-    check_for_key(name, key, scripts)
-
-
-def test_check_for_key_all_platforms():
-    name = "test"
-    key = "init"
-    scripts = {
-        "windows": {"init": "some_value"},
-        "mac": {"init": "some_value"},
-        "linux": {"init": "some_value"},
-    }
-    # Expect no exception to be raised
-    check_for_key(name, key, scripts)
-
-
-def test_check_for_key_missing_top_level():
-    name = "test"
-    key = "init"
-    scripts = {"windows": {}, "mac": {}, "linux": {}}
-    with pytest.raises(TypeError):
-        check_for_key(name, key, scripts)
-
-
-def test_check_for_key_missing_platforms():
+from startout.module import (
+    create_module,
+    check_for_key,
+    Module,
+    GitModule,
+    ScriptModule,
+)
+
+
+@pytest.mark.parametrize(
+    "scripts, defined",
+    [
+        ({"init": "some_value", "windows": {}, "mac": {}, "linux": {}}, True),
+        (
+            {
+                "windows": {"init": "some_value"},
+                "mac": {"init": "some_value"},
+                "linux": {"init": "some_value"},
+            },
+            True,
+        ),
+        ({"windows": {}, "mac": {}, "linux": {}}, False),
+        ({"windows": {"init": "some_value"}, "mac": {}, "linux": {}}, False),
+    ],
+    ids=["top_level", "all_platforms", "missing_top_level", "missing_platforms"],
+)
+def test_check_for_key(scripts, defined):
     name = "test"
     key = "init"
-    scripts = {"windows": {"init": "some_value"}, "mac": {}, "linux": {}}
-    with pytest.raises(TypeError):
+    if defined:
+        # Expect no exception to be raised
         check_for_key(name, key, scripts)
+    else:
+        with pytest.raises(TypeError):
+            check_for_key(name, key, scripts)
 
 
 @pytest.fixture
@@ -77,10 +75,9 @@ def test_create_module(dummy_module):
         "init": "exit 0",
         "destroy": "exit 0",
     }, "Script must be as expected"
-    assert result.dependencies == [
-        "module1",
-        "module2",
-    ], "Dependencies must be as expected"
+    assert result.dependencies == frozenset(
+        ["module1", "module2"]
+    ), "Dependencies must be as expected"
 
     assert (
         result.init_options[0].name == dummy_module["init_options"][0]["env_name"]
@@ -96,12 +93,34 @@ def test_create_module(dummy_module):
 def test_create_module_with_string_depends_on(dummy_module_string_dep):
     result = create_module(dummy_module_string_dep, "test_module")
 
-    assert result.dependencies == [
-        "module1"
-    ], "Dependencies must be as expected when given a string"
+    assert result.dependencies == frozenset(
+        ["module1"]
+    ), "Dependencies must be as expected when given a string"
 
 
 def test_create_module_with_empty_module():
     empty_module = {}
     with pytest.raises(Exception):
         create_module(empty_module, "test_module")
+
+
+def test_create_module_substitutes_dest(dummy_module, monkeypatch):
+    monkeypatch.setenv("DEST_ROOT", "/dest")
+    dummy_module["dest"] = "${DEST_ROOT}/path"
+
+    assert Module.module_schema.validate(dummy_module)["dest"] == "${DEST_ROOT}/path"
+    assert create_module(dummy_module, "test_module").dest == "/dest/path"
+
+
+@pytest.mark.parametrize(
+    "source, module_type",
+    [
+        ({"git": "https://github.com/repo.git"}, GitModule),
+        ({"script": "exit 0"}, ScriptModule),
+        ({"unknown": "exit 0"}, Module),
+    ],
+)
+def test_create_module_type(dummy_module, source, module_type):
+    dummy_module["source"] = source
+
+    assert type(create_module(dummy_module, "test_module")) is module_type
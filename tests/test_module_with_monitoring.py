@@ -1,7 +1,6 @@
 import os
 import subprocess
 from pathlib import Path
-from unittest import mock
 
 import pytest
 from rich.console import Console
@@ -43,107 +42,38 @@ def git_module():
     return module.GitModule(name, dest, source, scripts)
 
 
-def setup_module_mocks():
-    subprocess_run_mocked = mock.Mock()
-    subprocess_run_mocked.return_value.returncode = 0
-    run_mocked = mock.Mock()
-    run_mocked.return_value = ("success message", 0)
-    console_mocked = Console()
-    log_mocked = os.path.join(Path(__file__).parent, "logs", "startout.log")
-    return subprocess_run_mocked, run_mocked, console_mocked, log_mocked
+@pytest.fixture(scope="module")
+def monitor_args():
+    # The console and log file are only passed through to monitored_subprocess, so they are built once for the module
+    return Console(), os.path.join(Path(__file__).parent, "logs", "startout.log")
 
 
-def test_Module_initialize_with_monitor(basic_module):
-    # Using extracted setup function
-    subprocess_run_mocked, run_mocked, console_mocked, log_mocked = setup_module_mocks()
-    with mock.patch("shutil.which", return_value="/usr/bin/git"), mock.patch(
-        "startout.util.monitored_subprocess", new=subprocess_run_mocked
-    ), mock.patch.object(basic_module, "run", new=run_mocked):
-        assert basic_module.initialize(console_mocked, log_mocked)
-
-
-def test_Module_destroy_with_monitor(basic_module):
-    # Using extracted setup function
-    subprocess_run_mocked, run_mocked, console_mocked, log_mocked = setup_module_mocks()
-    with mock.patch("shutil.which", return_value="/usr/bin/git"), mock.patch(
-        "startout.util.monitored_subprocess", new=subprocess_run_mocked
-    ), mock.patch.object(basic_module, "run", new=run_mocked):
-        assert basic_module.destroy(console_mocked, log_mocked)
-
-
-@mock.patch("startout.module.monitored_subprocess")
-def test_Module_initialize_with_monitor(
-    mock_monitored_subprocess, basic_module, finished_process
-):
-    # Using extracted setup function
-    subprocess_run_mocked, run_mocked, console_mocked, log_mocked = setup_module_mocks()
-
-    # Define interactions for the monitored_subprocess mock
-    mock_monitored_subprocess.return_value = finished_process
-
-    assert basic_module.initialize(console_mocked, log_mocked)
-
-
-@mock.patch("startout.module.monitored_subprocess")
-def test_Module_destroy_with_monitor(
-    mock_monitored_subprocess, basic_module, finished_process
-):
-    # Using extracted setup function
-    subprocess_run_mocked, run_mocked, console_mocked, log_mocked = setup_module_mocks()
-
-    # Define interactions for the monitored_subprocess mock
-    mock_monitored_subprocess.return_value = finished_process
-
-    assert basic_module.destroy(console_mocked, log_mocked)
-
-
-@mock.patch("startout.module.monitored_subprocess")
-def test_ScriptModule_initialize_with_monitor(
-    mock_monitored_subprocess, script_module, finished_process
-):
-    # Using extracted setup function
-    subprocess_run_mocked, run_mocked, console_mocked, log_mocked = setup_module_mocks()
-
-    # Define interactions for the monitored_subprocess mock
-    mock_monitored_subprocess.return_value = finished_process
-
-    assert script_module.initialize(console_mocked, log_mocked)
+@pytest.fixture(autouse=True)
+def _monitored_subprocess(monkeypatch, finished_process):
+    monkeypatch.setattr(
+        module, "monitored_subprocess", lambda *args, **kwargs: finished_process
+    )
 
 
-@mock.patch("startout.module.monitored_subprocess")
-def test_ScriptModule_destroy_with_monitor(
-    mock_monitored_subprocess, script_module, finished_process
-):
-    # Using extracted setup function
-    subprocess_run_mocked, run_mocked, console_mocked, log_mocked = setup_module_mocks()
+def test_Module_initialize_with_monitor(basic_module, monitor_args):
+    assert basic_module.initialize(*monitor_args)
 
-    # Define interactions for the monitored_subprocess mock
-    mock_monitored_subprocess.return_value = finished_process
 
-    assert script_module.destroy(console_mocked, log_mocked)
+def test_Module_destroy_with_monitor(basic_module, monitor_args):
+    assert basic_module.destroy(*monitor_args)
 
 
-@mock.patch("startout.module.monitored_subprocess")
-def test_GitModule_initialize_with_monitor(
-    mock_monitored_subprocess, git_module, finished_process
-):
-    # Using extracted setup function
-    subprocess_run_mocked, run_mocked, console_mocked, log_mocked = setup_module_mocks()
+def test_ScriptModule_initialize_with_monitor(script_module, monitor_args):
+    assert script_module.initialize(*monitor_args)
 
-    # Define interactions for the monitored_subprocess mock
-    mock_monitored_subprocess.return_value = finished_process
 
-    assert git_module.initialize(console_mocked, log_mocked)
+def test_ScriptModule_destroy_with_monitor(script_module, monitor_args):
+    assert script_module.destroy(*monitor_args)
 
 
-@mock.patch("startout.module.monitored_subprocess")
-def test_GitModule_destroy_with_monitor(
-    mock_monitored_subprocess, git_module, finished_process
-):
-    # Using extracted setup function
-    subprocess_run_mocked, run_mocked, console_mocked, log_mocked = setup_module_mocks()
+def test_GitModule_initialize_with_monitor(git_module, monitor_args):
+    assert git_module.initialize(*monitor_args)
 
-    # Define interactions for the monitored_subprocess mock
-    mock_monitored_subprocess.return_value = finished_process
 
-    assert git_module.destroy(console_mocked, log_mocked)
+def test_GitModule_destroy_with_monitor(git_module, monitor_args):
+    assert git_module.destroy(*monitor_args)
@@ -2,23 +2,22 @@ import subprocess
 import unittest
 from unittest.mock import patch
 
+import pytest
 from parameterized import parameterized
 
 from startout.paths import initialize_repo, new_repo_owner_interactive
 
 
+@pytest.mark.usefixtures("paths_console")
 class TestInitializeRepo(unittest.TestCase):
     def setUp(self):
         self.patcher1 = patch(
             "startout.github_api.create_repo_from_temp", autospec=True
         )
-        self.patcher2 = patch("startout.paths.console", autospec=True)
         self.mock_create_repo = self.patcher1.start()
-        self.mock_console = self.patcher2.start()
 
     def tearDown(self):
         self.patcher1.stop()
-        self.patcher2.stop()
 
     # fmt: off
     @parameterized.expand([
@@ -68,16 +67,11 @@ class TestInitializeRepo(unittest.TestCase):
 
 
 @unittest.mock.patch("subprocess.run")
+@pytest.mark.usefixtures("paths_console")
 class TestNewRepoOwnerInteractive(unittest.TestCase):
     def setUp(self):
         self.username = "goose"
 
-        self.console_patcher = patch("startout.paths.console", autospec=True)
-        self.mock_console = self.console_patcher.start()
-
-    def tearDown(self):
-        self.console_patcher.stop()
-
     def default_subprocess_side_effect(self, *args, **kwargs):
         if args[0] == ["gh", "auth", "status"]:
             user_string = b"\naccount " + self.username.encode("utf-8")
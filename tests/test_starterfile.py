@@ -1,10 +1,13 @@
 import os
+import stat
 import unittest
+from unittest import mock
 
 import pytest
 
+import startout.starterfile
 from startout.starterfile import Starter
-from startout.tool import InstallationMode
+from startout.tool import InstallationMode, InstallationStatus
 
 
 class InitOption:
@@ -28,6 +31,7 @@ class Tool:
         self.mock_check = mock_check
         self.mock_destroy = mock_destroy
         self.mock_initialize = mock_initialize
+        self.dependencies = None
         self.alt = None
         self.mode = InstallationMode.INSTALL
 
@@ -92,6 +96,11 @@ class TestStarter(unittest.TestCase):
             ("", InitOption(str(i))) for i in range(5)
         ]
 
+    def test_iter_init_options(self):
+        init_options = self.starter_successful_init.iter_init_options()
+        assert not isinstance(init_options, list)
+        assert list(init_options) == self.starter_successful_init.get_init_options()
+
     def test_set_init_options(self):
         test_options = {("", "1"): "Value"}
         self.starter_successful_init.set_init_options(test_options)
@@ -108,6 +117,37 @@ class TestStarter(unittest.TestCase):
         assert not self.starter_failure_init.up()
 
 
+@pytest.mark.skipif(os.name == "nt", reason="No POSIX permission bits")
+def test_up_keeps_startersteps_mode(tmp_path, monkeypatch):
+    # Mock a Startersteps.md file that refers to an environment variable
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PROJECT", "golden")
+    steps = tmp_path / "Startersteps.md"
+    steps.write_text("Welcome to ${PROJECT}\n")
+    steps.chmod(0o640)
+
+    Starter([], [], [], []).up()
+
+    assert steps.read_text() == "Welcome to golden\n"
+    assert stat.S_IMODE(steps.stat().st_mode) == 0o640
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["Startersteps.md"]
+
+
+def test_up_removes_temporary_startersteps_on_failure(tmp_path, monkeypatch):
+    # Mock a failure partway through the environment variable replacement
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "Startersteps.md").write_text("Welcome to ${PROJECT}\n")
+
+    with mock.patch(
+        "startout.starterfile.replace_env", side_effect=RuntimeError("failed")
+    ):
+        with pytest.raises(RuntimeError):
+            Starter([], [], [], []).up()
+
+    assert (tmp_path / "Startersteps.md").read_text() == "Welcome to ${PROJECT}\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["Startersteps.md"]
+
+
 def test_install_tools_no_tools():
     starter = Starter([], [], [], [])
     assert (
@@ -142,16 +182,42 @@ def test_install_tools_fail_early():
     ), "Should return False as tool '5' fails to initialize."
 
 
+def test_install_tools_fail_early_skips_rest_of_layer():
+    # Mock tools, counting their initializations
+    tools = [Tool(str(i), False, (i != 2), True) for i in range(5)]
+    for tool in tools:
+        tool.initialize = mock.Mock(return_value=tool.mock_initialize)
+    starter = Starter([], tools, [], [[t.name for t in tools]])
+    assert not starter.install_tools(fail_early=True, parallel=False)
+    assert [t.initialize.call_count for t in tools] == [1, 1, 1, 0, 0]
+
+
 def test_install_tools_teardown_on_failure():
     # Mock tools
     tools = [Tool(str(i), False, (i != 5), (i != 6)) for i in range(10)]
     starter = Starter([], tools, [], [[t.name for t in tools]])
     with pytest.raises(SystemExit):
         starter.install_tools(
-            teardown_on_failure=True
+            teardown_on_failure=True, fail_early=False
         ), "Should raise SystemExit as tool '6' fails to destroy."
 
 
+def test_install_tools_teardown_destroys_installed_tools():
+    # Mock an existing tool, two newly installed tools and a failing tool in the last layer
+    tools = [
+        Tool("existing", True, True, True),
+        Tool("new_1", False, True, True),
+        Tool("new_2", False, True, True),
+        Tool("broken", False, False, True),
+    ]
+    starter = Starter([], tools, [], [["existing", "new_1"], ["new_2"], ["broken"]])
+    with mock.patch.object(
+        Tool, "destroy", autospec=True, return_value=True
+    ) as destroy:
+        assert not starter.install_tools(teardown_on_failure=True)
+    assert [call.args[0].name for call in destroy.call_args_list] == ["new_1", "new_2"]
+
+
 def test_install_tools_no_teardown_on_failure():
     # Mock tools
     tools = [Tool(str(i), False, (i != 5), (i != 6)) for i in range(10)]
@@ -161,6 +227,139 @@ def test_install_tools_no_teardown_on_failure():
     ), "Should return False as tool '5' fails to initialize."
 
 
+def test_install_tools_in_parallel():
+    # Mock uninitialized tools
+    tools = [Tool(str(i), False, True, True) for i in range(10)]
+    starter = Starter([], tools, [], [[t.name for t in tools]])
+    assert starter.install_tools(
+        parallel=True
+    ), "Should return True when all tools are successfully installed concurrently."
+
+
+def test_install_tools_installs_serially_by_default():
+    # Mock uninitialized tools in one layer
+    tools = [Tool(str(i), False, True, True) for i in range(5)]
+    starter = Starter([], tools, [], [[t.name for t in tools]])
+    with mock.patch(
+        "startout.starterfile._map_layer", wraps=startout.starterfile._map_layer
+    ) as map_layer:
+        assert starter.install_tools()
+
+    # Only the up-front checks are run concurrently, the layer is installed one tool at a time
+    assert [call.args[2] for call in map_layer.call_args_list] == [True, False]
+
+
+def test_install_tools_checks_each_tool_once():
+    # Mock tools spread over several layers, checked before any layer is installed
+    tools = [Tool(str(i), False, True, True) for i in range(6)]
+    starter = Starter([], tools, [], [["0", "1"], ["2", "3"], ["4", "5"]])
+    with mock.patch.object(Tool, "check", autospec=True, return_value=False) as check:
+        assert starter.install_tools()
+    assert sorted(call.args[0].name for call in check.call_args_list) == [
+        str(i) for i in range(6)
+    ]
+
+
+def test_install_tools_checks_duplicate_tools_once():
+    # Mock a tool that is listed twice
+    tool = Tool("duplicate", True, True, True)
+    starter = Starter([], [tool, tool], [], [["duplicate"]])
+    with mock.patch.object(Tool, "check", autospec=True, return_value=True) as check:
+        assert starter.install_tools()
+    check.assert_called_once_with(tool)
+
+
+def test_install_tools_reuses_check_results():
+    # Mock an installed tool, which is not checked again, and a tool that is installed by the first run
+    tools = [Tool("installed", True, True, True), Tool("missing", False, True, True)]
+    starter = Starter([], tools, [], [["installed", "missing"]])
+    with mock.patch.object(
+        Tool, "check", autospec=True, side_effect=lambda tool: tool.mock_check
+    ) as check:
+        assert starter.install_tools()
+        assert starter.install_tools()
+    assert [call.args[0].name for call in check.call_args_list].count("installed") == 1
+    assert [call.args[0].name for call in check.call_args_list].count("missing") == 2
+
+
+def test_install_tools_checks_dependents_again_after_install():
+    # Mock a tool whose installation also installs the tool that depends on it, e.g. node and npm
+    node = Tool("node", False, True, True)
+    npm = Tool("npm", False, True, True)
+    npm.dependencies = frozenset(["node"])
+    npm.initialize = mock.Mock(return_value=True)
+
+    def initialize_node():
+        npm.mock_check = True
+        return True
+
+    node.initialize = initialize_node
+    starter = Starter([], [node, npm], [], [["node"], ["npm"]])
+
+    assert starter.install_tools()
+    npm.initialize.assert_not_called()
+    assert npm.status == InstallationStatus.EXISTING_INSTALLATION
+
+
+def test_install_tools_reports_layer_in_order(capsys):
+    # Mock an installed tool, a tool that is installed, and a tool that fails to install in one layer
+    tools = [
+        Tool("installed", True, True, True),
+        Tool("new", False, True, True),
+        Tool("broken", False, False, True),
+    ]
+    starter = Starter([], tools, [], [["installed", "new", "broken"]])
+    assert not starter.install_tools(teardown_on_failure=False, fail_early=False)
+    assert capsys.readouterr().out.splitlines()[1:] == [
+        ".. Tool 'installed' is already installed, skipping.",
+        ".. Tool 'new' installed successfully.",
+        ".. Tool 'broken' failed to install.",
+    ]
+
+
+def test_install_tools_uses_alt():
+    # Mock a tool that fails to install, and its alt which is installed in its place
+    alt = Tool("alt", False, True, True)
+    alt.mode = InstallationMode.AS_ALT
+    broken = Tool("broken", False, False, True)
+    broken.alt = "alt"
+    starter = Starter([], [alt, broken], [], [["alt"], ["broken"]])
+    assert starter.install_tools(), "Should return True when the alt is installed."
+    assert alt.mode == InstallationMode.INSTALL
+    assert starter.tool_dependencies == [["alt"], ["broken", "alt"]]
+
+
+def test_install_tools_optional_prompt():
+    # Mock optional tools, of which the user chooses to install two
+    tools = [Tool(str(i), False, True, True) for i in range(5)]
+    for tool in tools:
+        tool.mode = InstallationMode.OPTIONAL
+    starter = Starter([], tools, [], [[t.name for t in tools]])
+    console = mock.Mock()
+    console.input.return_value = "1, 3"
+
+    assert starter.install_tools(console=console)
+    console.input.assert_called_once()
+    assert [t.mode for t in tools] == [
+        InstallationMode.OPTIONAL,
+        InstallationMode.INSTALL,
+        InstallationMode.OPTIONAL,
+        InstallationMode.INSTALL,
+        InstallationMode.OPTIONAL,
+    ]
+
+
+def test_install_tools_optional_assumption():
+    # Mock optional tools, which are all installed without prompting
+    tools = [Tool(str(i), False, True, True) for i in range(5)]
+    for tool in tools:
+        tool.mode = InstallationMode.OPTIONAL
+    starter = Starter([], tools, [], [[t.name for t in tools]])
+
+    assert starter.install_tools(assumption=True)
+    assert all(t.mode == InstallationMode.INSTALL for t in tools)
+
+
 def test_install_modules_no_modules():
     starter = Starter([], [], [], [])
     assert (
@@ -201,10 +400,19 @@ def test_install_modules_teardown_on_failure():
     starter = Starter(modules, [], [[m.name for m in modules]], [])
     with pytest.raises(SystemExit):
         starter.install_modules(
-            teardown_on_failure=True
+            teardown_on_failure=True, fail_early=False
         ), "Should raise SystemExit as module '6' fails to destroy."
 
 
+def test_install_modules_in_parallel():
+    # Mock uninitialized modules
+    modules = [Module(str(i), False, True, True) for i in range(10)]
+    starter = Starter(modules, [], [[m.name for m in modules]], [])
+    assert starter.install_modules(
+        parallel=True
+    ), "Should return True when all modules are successfully installed concurrently."
+
+
 def test_install_modules_no_teardown_on_failure():
     # Mock tools
     modules = [Module(str(i), False, (i != 5), (i != 6)) for i in range(10)]
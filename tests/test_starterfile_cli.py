@@ -3,6 +3,7 @@ import unittest
 from unittest import mock
 from unittest.mock import patch
 
+import pytest
 from parameterized import parameterized
 
 import startout.paths
@@ -25,6 +26,9 @@ class Starter:
 
         return []
 
+    def iter_init_options(self):
+        return iter(self.get_init_options())
+
     def set_init_options(self, _):
         pass
 
@@ -45,30 +49,18 @@ class InitOption:
 # @mock.patch('startout.paths.new_repo_owner_interactive')
 # @mock.patch('startout.paths.gh_api.check_repo_custom_property')
 # @mock.patch('startout.paths.re.match')
+@pytest.mark.usefixtures("path_params", "paths_console")
 class TestStarterFileCLI(unittest.TestCase):
-
     def setUp(self):
         self.safe_dir = os.getcwd()
         self.safe_env_vars = os.environ.copy()
 
-        # Test parameters
-        self.fully_formed_template_name = "Github/Repository"
-        self.startout_path_template_name = "test-test"
-        self.new_repo_name = "NewRepo"
-        self.new_repo_owner = "Owner"
-        self.public = True
-        self.created_repo_path = "path/to/repo"
-
-        self.console_patcher = patch("startout.paths.console", autospec=True)
-        self.mock_console = self.console_patcher.start()
-
         self.console_height_patcher = patch("startout.paths.console.height", new=4)
         self.console_height_patcher.start()
 
         self.mock_starter_valid = Starter("MockStarter")
 
     def tearDown(self):
-        self.console_patcher.stop()
         self.console_height_patcher.stop()
         os.chdir(self.safe_dir)
         os.environ.clear()
@@ -3,22 +3,17 @@ import unittest
 from unittest import mock
 from unittest.mock import patch
 
+import pytest
+
 import startout.paths
 
 
+@pytest.mark.usefixtures("path_params", "paths_console")
 class TestStarterFileEnvironmentVariableFunctions(unittest.TestCase):
-
     def setUp(self):
         self.safe_dir = os.getcwd()
         self.safe_env_vars = os.environ.copy()
 
-        # Test parameters
-        self.fully_formed_template_name = "Github/Repository"
-        self.startout_path_template_name = "test-test"
-        self.new_repo_name = "NewRepo"
-        self.new_repo_owner = "Owner"
-        self.public = True
-        self.created_repo_path = "path/to/repo"
         self.mock_api_key = "Fhd@aF+88nZV$h4YFe445"
 
         self.final_env_file = f"""EXISTING_VAR=wasAlreadyHere
@@ -27,14 +22,10 @@ ONE=1
 API_KEY={self.mock_api_key}
 """
 
-        self.console_patcher = patch("startout.paths.console", autospec=True)
-        self.mock_console = self.console_patcher.start()
-
         self.console_height_patcher = patch("startout.paths.console.height", new=4)
         self.console_height_patcher.start()
 
     def tearDown(self):
-        self.console_patcher.stop()
         self.console_height_patcher.stop()
         os.chdir(self.safe_dir)
         os.environ.clear()
@@ -1,10 +1,16 @@
+import io
 import os
+import shutil
+import stat
 import unittest
+from unittest import mock
 
 import pytest
 import schema
+import yaml
 
 from startout.module import ScriptModule
+import startout.starterfile
 from startout.starterfile import parse_starterfile, Starter
 from startout.tool import Tool
 
@@ -93,6 +99,143 @@ def test_parse_starterfile_succeeds(starterfile_path: str, expected_starter_fact
         assert actual_starter == expected_starter
 
 
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without LibYAML")
+def test_parse_starterfile_uses_libyaml():
+    """
+    Test that Starterfiles are loaded with the LibYAML safe loader when it is available.
+    """
+    assert startout.starterfile.SafeLoader is yaml.CSafeLoader
+
+    with mock.patch(
+        "startout.starterfile.yaml.load", side_effect=yaml.load
+    ) as mock_load:
+        with open(os.path.join(TEST_DATA_DIR, "starter1.yaml"), "r") as file:
+            assert parse_starterfile(file) == build_starter_1()
+    assert mock_load.call_args.kwargs["Loader"] is yaml.CSafeLoader
+
+
+def test_parse_starterfile_uses_cache(tmp_path):
+    """
+    Test that an unchanged Starterfile is loaded from the cache instead of parsed again.
+    """
+    starterfile_path = tmp_path / "Starterfile.yaml"
+    shutil.copy(os.path.join(TEST_DATA_DIR, "starter2.yaml"), starterfile_path)
+
+    with open(starterfile_path, "r") as file:
+        assert parse_starterfile(file) == build_starter_2()
+
+    with mock.patch("startout.starterfile.yaml.load") as mock_load:
+        with open(starterfile_path, "r") as file:
+            assert parse_starterfile(file) == build_starter_2()
+        mock_load.assert_not_called()
+
+    # Any change to the Starterfile invalidates the cache
+    with open(os.path.join(TEST_DATA_DIR, "starter1.yaml"), "r") as source:
+        starterfile_path.write_text(source.read())
+    with open(starterfile_path, "r") as file:
+        assert parse_starterfile(file) == build_starter_1()
+
+
+def test_parse_starterfile_cache_detects_edit_with_same_size_and_mtime(tmp_path):
+    """
+    Test that an edit which keeps the size and mtime of the Starterfile (e.g. a checkout) is not hidden by the cache.
+    """
+    starterfile_path = tmp_path / "Starterfile.yaml"
+    shutil.copy(os.path.join(TEST_DATA_DIR, "starter1.yaml"), starterfile_path)
+
+    with open(starterfile_path, "r") as file:
+        assert parse_starterfile(file) == build_starter_1()
+
+    original = os.stat(starterfile_path)
+    starterfile_path.write_text(
+        starterfile_path.read_text().replace("init: exit 0", "init: exit 1")
+    )
+    os.utime(starterfile_path, ns=(original.st_atime_ns, original.st_mtime_ns))
+    assert os.stat(starterfile_path).st_size == original.st_size
+
+    with open(starterfile_path, "r") as file:
+        starter = parse_starterfile(file)
+    assert starter.modules[0].scripts["init"] == "exit 1"
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="No owner of files to check")
+def test_parse_starterfile_cache_is_private(tmp_path, starterfile_cache_dir):
+    """
+    Test that the cache directory is only readable by the current user, and entries in a directory of someone else
+    are never used.
+    """
+    starterfile_path = tmp_path / "Starterfile.yaml"
+    shutil.copy(os.path.join(TEST_DATA_DIR, "starter2.yaml"), starterfile_path)
+
+    with open(starterfile_path, "r") as file:
+        assert parse_starterfile(file) == build_starter_2()
+    assert stat.S_IMODE(os.stat(starterfile_cache_dir).st_mode) == 0o700
+    for entry in starterfile_cache_dir.iterdir():
+        assert stat.S_IMODE(entry.stat().st_mode) == 0o600
+
+    with mock.patch.object(
+        startout.starterfile.os, "getuid", return_value=os.getuid() + 1
+    ), mock.patch("startout.starterfile.yaml.load", side_effect=yaml.load) as mock_load:
+        with open(starterfile_path, "r") as file:
+            assert parse_starterfile(file) == build_starter_2()
+        mock_load.assert_called_once()
+
+
+def test_parse_starterfile_skips_validation_when_unchanged(tmp_path):
+    """
+    Test that the schemas are only checked again for a cached Starterfile when asked to.
+    """
+    starterfile_path = tmp_path / "Starterfile.yaml"
+    shutil.copy(os.path.join(TEST_DATA_DIR, "starter2.yaml"), starterfile_path)
+
+    with open(starterfile_path, "r") as file:
+        assert parse_starterfile(file) == build_starter_2()
+
+    with mock.patch.object(Starter, "starterfile_schema") as mock_schema:
+        with open(starterfile_path, "r") as file:
+            assert parse_starterfile(file) == build_starter_2()
+        mock_schema.validate.assert_not_called()
+
+        with open(starterfile_path, "r") as file:
+            parse_starterfile(file, validate=True)
+        mock_schema.validate.assert_called_once()
+
+
+def test_parse_starterfile_validates_entries_of_other_versions(tmp_path, monkeypatch):
+    """
+    Test that a cached Starterfile that passed validation under another version of startout or its schemas is
+    validated again.
+    """
+    starterfile_path = tmp_path / "Starterfile.yaml"
+    shutil.copy(os.path.join(TEST_DATA_DIR, "starter2.yaml"), starterfile_path)
+
+    with open(starterfile_path, "r") as file:
+        assert parse_starterfile(file) == build_starter_2()
+
+    # Forget the contents that passed validation in this process, as a later run of startout would
+    monkeypatch.setattr(startout.starterfile, "_VALIDATED_STARTERFILES", set())
+    with mock.patch.object(
+        startout.starterfile, "_starterfile_cache_version", return_value="0.0.0-old"
+    ), mock.patch.object(Starter, "starterfile_schema") as mock_schema:
+        with open(starterfile_path, "r") as file:
+            parse_starterfile(file)
+        mock_schema.validate.assert_called_once()
+
+
+def test_parse_starterfile_remembers_validated_contents():
+    """
+    Test that contents that passed validation are not checked again in the same process, even without a file.
+    """
+    with open(os.path.join(TEST_DATA_DIR, "starter1.yaml"), "r") as file:
+        contents = file.read()
+
+    assert parse_starterfile(io.StringIO(contents)) == build_starter_1()
+
+    with mock.patch.object(Starter, "starterfile_schema") as mock_schema:
+        assert parse_starterfile(io.StringIO(contents)) == build_starter_1()
+        mock_schema.validate.assert_not_called()
+
+
 class TestParseStarterfileFails(unittest.TestCase):
     def setUp(self):
         self.broken = "non_starter.yaml"
@@ -116,3 +259,33 @@ class TestParseStarterfileFails(unittest.TestCase):
         with open(starterfile_path, "r") as file:
             with self.assertRaises(schema.SchemaMissingKeyError):
                 parse_starterfile(file)
+
+    def test_parse_starterfile_fails_with_invalid_module(self):
+        starterfile = io.StringIO(
+            "tools:\n"
+            "  tool:\n"
+            "    scripts: {check: exit 0, install: exit 0, uninstall: exit 0}\n"
+            "modules:\n"
+            "  module:\n"
+            "    dest: path/to/module\n"
+            "    source: {script: exit 0}\n"
+        )
+        with self.assertRaises(schema.SchemaError):
+            parse_starterfile(starterfile)
+
+    def test_parse_starterfile_fails_with_invalid_tool(self):
+        starterfile = io.StringIO(
+            "tools:\n"
+            "  tool:\n"
+            "    mode: sometimes\n"
+            "    scripts: {check: exit 0, install: exit 0, uninstall: exit 0}\n"
+            "modules:\n"
+            "  module:\n"
+            "    dest: path/to/module\n"
+            "    source: {script: exit 0}\n"
+            "    scripts: {init: exit 0, destroy: exit 0}\n"
+        )
+        with mock.patch.object(Tool, "tool_schema") as mock_tool_schema:
+            with self.assertRaises(schema.SchemaError):
+                parse_starterfile(starterfile)
+        mock_tool_schema.validate.assert_not_called()
@@ -1,3 +1,6 @@
+import os
+from unittest import mock
+
 import pytest
 
 from startout import starterfile
@@ -62,3 +65,54 @@ def test_create_dependency_layers_with_circular_dependency():
         modules = [Module(f"Module_{i}", [f"Module_{(i + 1) % 5}"]) for i in range(5)]
         starterfile.create_dependency_layers(modules)
     assert str(e.value) == "1"
+
+
+def test_create_dependency_layers_with_shared_dependencies():
+    """Tests create_dependency_layers function with items depending on more than one earlier layer."""
+    items = [
+        Module("Module_0", None),
+        Tool("Tool_1", ["Module_0"]),
+        Module("Module_2", ["Module_0", "Tool_1"]),
+        Tool("Tool_3", ["Module_0"]),
+    ]
+    layers = starterfile.create_dependency_layers(items)
+    assert layers[0] == ["Module_0"]
+    assert sorted(layers[1]) == ["Tool_1", "Tool_3"]
+    assert layers[2] == ["Module_2"]
+
+
+def test_create_dependency_layers_keeps_definition_order():
+    """Tests that the items of each layer are in the order they are defined in."""
+    modules = [
+        Module("Module_0", ["Module_4"]),
+        Module("Module_1", ["Module_3"]),
+        Module("Module_2", ["Module_4", "Module_3"]),
+        Module("Module_3", None),
+        Module("Module_4", None),
+    ]
+    layers = starterfile.create_dependency_layers(modules)
+    assert layers == [["Module_3", "Module_4"], ["Module_0", "Module_1", "Module_2"]]
+
+
+def test_load_env_file(tmp_path, monkeypatch):
+    """Tests that load_env_file only loads an env file again when doing so would change the environment."""
+    monkeypatch.delenv("LOAD_ENV_FILE_TEST", raising=False)
+    env_file = tmp_path / "test.env"
+    env_file.write_text("LOAD_ENV_FILE_TEST=loaded\n")
+
+    starterfile.load_env_file(str(env_file))
+    assert os.environ["LOAD_ENV_FILE_TEST"] == "loaded"
+
+    with mock.patch("dotenv.load_dotenv") as mock_load:
+        starterfile.load_env_file(str(env_file))
+        mock_load.assert_not_called()
+
+        monkeypatch.delenv("LOAD_ENV_FILE_TEST")
+        starterfile.load_env_file(str(env_file))
+        mock_load.assert_called_once_with(str(env_file))
+
+
+def test_load_env_file_missing(tmp_path, capsys):
+    """Tests that load_env_file warns about and skips env files that do not exist."""
+    starterfile.load_env_file(str(tmp_path / "missing.env"))
+    assert "missing.env" in capsys.readouterr().err
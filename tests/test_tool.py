@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from parameterized import parameterized
 
@@ -16,10 +18,45 @@ def test_init_valid_scripts():
 
     tool = Tool(name, dependencies, scripts)
     assert tool.name == name
-    assert tool.dependencies == dependencies
+    assert tool.dependencies == frozenset(dependencies)
     assert tool.scripts == scripts
 
 
+def test_run_uses_scripts_resolved_at_init():
+    scripts = {
+        "install": "exit 1",
+        "uninstall": "exit 0",
+        "check": "exit 0",
+        "linux": {"install": "exit 0"},
+        "mac": {"install": "exit 0"},
+        "windows": {"install": "exit 0"},
+    }
+    _tool = Tool("test_tool", None, scripts)
+
+    with mock.patch("startout.tool.get_script") as mock_get_script:
+        assert _tool.initialize()
+    mock_get_script.assert_not_called()
+
+
+def test_equality_after_run():
+    scripts = {
+        "install": "exit 0",
+        "uninstall": "exit 0",
+        "check": "exit 0",
+        "build": "exit 0",
+    }
+    a = Tool("test_tool", None, scripts)
+    b = Tool("test_tool", None, scripts)
+
+    with mock.patch(
+        "startout.tool.run_script_with_env_substitution", return_value=("", 0)
+    ):
+        a.run("build")
+
+    assert a == b
+    assert hash(a) == hash(b)
+
+
 def test_init_missing_install_script():
     name = "test_tool"
     dependencies = ["dep1", "dep2"]
@@ -1,9 +1,12 @@
+import io
 import math
 import os
+import sys
 import unittest
 from unittest.mock import patch
 
 import pytest
+from rich.console import Console
 
 from startout import util
 from startout.util import bool_to_yn, bool_to_strings, string_to_bool, calculate_entropy
@@ -82,10 +85,45 @@ def test_calculate_entropy_all_distinct():
     assert math.isclose(result, 2.0, abs_tol=1e-6), 'Entropy of set with all distinct elements should be 2'
 
 
+def test_calculate_entropy_string():
+    data = 'aabbbc'
+    result = calculate_entropy(data)
+    assert math.isclose(result, calculate_entropy(list(data)), abs_tol=1e-9), 'Entropy of a string should match its characters'
+
+
+def test_is_potentially_sensitive_key_value_high_entropy():
+    assert util.is_potentially_sensitive_key_value('VAR', 'abcdefghijkl'), 'Values with high entropy are sensitive'
+
+
+@pytest.mark.parametrize('key', ['API_KEY', 'github_token', 'DB_Password', 'CLIENT_SECRET', 'PRIVATE_KEY', 'AWS_ACCESS_KEY_ID'])
+def test_is_potentially_sensitive_key_value_sensitive_key(key):
+    assert util.is_potentially_sensitive_key_value(key, 'value'), 'Keys matching a sensitive pattern are sensitive'
+
+
+@patch("startout.util.calculate_entropy")
+def test_is_potentially_sensitive_key_value_skips_short_values(mock_entropy):
+    assert not util.is_potentially_sensitive_key_value('VAR', 'abcdefghijk')
+    mock_entropy.assert_not_called()
+
+
+def test_monitored_subprocess_without_terminal():
+    console = Console(file=io.StringIO())
+    with patch("rich.live.Live") as mock_live:
+        result = util.monitored_subprocess(
+            [sys.executable, "-c", "print('out', flush=True); import sys; print('err', file=sys.stderr)"],
+            title=None,
+            subtitle=None,
+            console=console,
+        )
+    mock_live.assert_not_called()
+    assert result.returncode == 0
+    assert result.stdout.splitlines() == ['out', 'err'], 'Output should be captured along with stderr'
+
+
 class TestGetScript(unittest.TestCase):
 
-    @patch("platform.system", return_value="Windows")
-    def test_get_script_for_windows(self, _):
+    @patch("startout.util._PLATFORM_KEY", "windows")
+    def test_get_script_for_windows(self):
         script = "test_script"
         scripts_dict = {
             "test_script": 'echo "Top level script"',
@@ -97,8 +135,8 @@ class TestGetScript(unittest.TestCase):
         result = util.get_script(script, scripts_dict, name)
         self.assertEqual(result, expected_result)
 
-    @patch("platform.system", return_value="Darwin")
-    def test_get_script_for_mac(self, _):
+    @patch("startout.util._PLATFORM_KEY", "mac")
+    def test_get_script_for_mac(self):
         script = "test_script"
         scripts_dict = {
             "test_script": 'echo "Top level script"',
@@ -110,8 +148,8 @@ class TestGetScript(unittest.TestCase):
         result = util.get_script(script, scripts_dict, name)
         self.assertEqual(result, expected_result)
 
-    @patch("platform.system", return_value="Linux")
-    def test_get_script_for_linux(self, _):
+    @patch("startout.util._PLATFORM_KEY", "linux")
+    def test_get_script_for_linux(self):
         script = "test_script"
         scripts_dict = {
             "test_script": 'echo "Top level script"',
@@ -123,8 +161,8 @@ class TestGetScript(unittest.TestCase):
         result = util.get_script(script, scripts_dict, name)
         self.assertEqual(result, expected_result)
 
-    @patch("platform.system", return_value="Linux")
-    def test_get_script_top_level(self, _):
+    @patch("startout.util._PLATFORM_KEY", "linux")
+    def test_get_script_top_level(self):
         script = "test_script"
         scripts_dict = {
             "test_script": 'echo "Top level script"',
@@ -135,6 +173,17 @@ class TestGetScript(unittest.TestCase):
         result = util.get_script(script, scripts_dict, name)
         self.assertEqual(result, expected_result)
 
+    @patch("startout.util._PLATFORM_KEY", "linux")
+    def test_get_script_ignores_other_platforms(self):
+        scripts_dict = {
+            "test_script": 'echo "Top level script"',
+            "windows": {"test_script": 'echo "Windows script"'},
+            "mac": {"test_script": 'echo "Mac script"'},
+        }
+
+        result = util.get_script("test_script", scripts_dict, "script_tool")
+        self.assertEqual(result, 'echo "Top level script"')
+
     def test_get_script_none(self):
         script = "not_a_script"
         scripts_dict = {"test_script": "exit 0"}
@@ -192,6 +241,21 @@ class TestReplaceEnv(unittest.TestCase):
         expected = "Hello ${UNDEFINED_VAR}"
         assert expected == util.replace_env(expected)
 
+    def test_replace_env_does_not_substitute_values(self):
+        os.environ["FOO"] = "Bar"
+        os.environ["NESTED"] = "${FOO}"
+        self.assertEqual(util.replace_env("${NESTED} ${FOO}"), "${FOO} Bar")
+
+    def test_replace_env_leaves_shell_syntax(self):
+        os.environ["FOO"] = "Bar"
+        self.assertEqual(
+            util.replace_env("echo $FOO $$ ${FOO}"), "echo $FOO $$ Bar"
+        )
+
+    def test_replace_env_adjacent_variables(self):
+        os.environ["FOO"] = "Bar"
+        self.assertEqual(util.replace_env("${FOO}${FOO}/${}"), "BarBar/${}")
+
 
 class TestBoolConversion(unittest.TestCase):
 
@@ -200,8 +264,8 @@ class TestBoolConversion(unittest.TestCase):
         self.assertEqual(bool_to_yn(False), "n")
 
     def test_bool_to_strings(self):
-        self.assertListEqual(bool_to_strings(True), ["yes", "y", "true"])
-        self.assertListEqual(bool_to_strings(False), ["no", "n", "false"])
+        self.assertEqual(bool_to_strings(True), frozenset(["yes", "y", "true"]))
+        self.assertEqual(bool_to_strings(False), frozenset(["no", "n", "false"]))
 
     def test_string_to_bool(self):
         self.assertEqual(string_to_bool("yes"), True)
@@ -7,6 +7,10 @@ from startout import util
 
 class TestRunScriptWithEnvSubstitution(unittest.TestCase):
 
+    def setUp(self):
+        util._which.cache_clear()
+        util._split_script.cache_clear()
+
     @mock.patch("subprocess.run")
     @mock.patch("shutil.which")
     @mock.patch("shlex.split")
@@ -55,6 +59,134 @@ class TestRunScriptWithEnvSubstitution(unittest.TestCase):
         self.assertEqual(output, "An error occurred")
         self.assertEqual(returncode, 1)
 
+    @mock.patch("subprocess.run")
+    @mock.patch("shutil.which")
+    def test_run_script_with_env_substitution_caches_path_lookup(
+        self, mock_which, mock_run
+    ):
+        mock_which.return_value = "/bin/echo"
+        mock_run.return_value = mock.Mock(stdout="Hello\n", returncode=0)
+
+        util.run_script_with_env_substitution("echo Hello")
+        util.run_script_with_env_substitution("echo World")
+
+        mock_which.assert_called_once_with("echo")
+        mock_run.assert_called_with(
+            ["echo", "World"],
+            executable="/bin/echo",
+            close_fds=False,
+            text=True,
+            capture_output=True,
+        )
+
+    @mock.patch("subprocess.run")
+    @mock.patch("shutil.which")
+    def test_run_script_with_env_substitution_stale_path_lookup(
+        self, mock_which, mock_run
+    ):
+        # The command moved since it was looked up, so it is looked up again and run from its new path
+        mock_which.side_effect = ["/bin/moved_command", "/usr/bin/moved_command"]
+        mock_run.side_effect = [
+            FileNotFoundError("moved_command"),
+            subprocess.CompletedProcess([], stdout="moved\n", returncode=0),
+        ]
+
+        output, returncode = util.run_script_with_env_substitution("moved_command")
+        self.assertEqual((output, returncode), ("moved\n", 0))
+        self.assertEqual(
+            mock_run.call_args.kwargs["executable"], "/usr/bin/moved_command"
+        )
+
+    @mock.patch("subprocess.run")
+    @mock.patch("shutil.which")
+    def test_run_script_with_env_substitution_stale_path_lookup_runs_in_shell(
+        self, mock_which, mock_run
+    ):
+        # The command was removed since it was looked up, so the script falls back to the shell
+        mock_which.side_effect = ["/bin/removed_command", None]
+        mock_run.side_effect = [
+            FileNotFoundError("removed_command"),
+            subprocess.CompletedProcess(
+                [], stdout="removed_command: not found", returncode=127
+            ),
+        ]
+
+        output, returncode = util.run_script_with_env_substitution("removed_command")
+        self.assertEqual((output, returncode), ("removed_command: not found", 127))
+        mock_run.assert_called_with(
+            "removed_command", shell=True, text=True, capture_output=True
+        )
+
+    @mock.patch("subprocess.run")
+    @mock.patch("shutil.which")
+    @mock.patch("shlex.split")
+    def test_run_script_with_env_substitution_caches_split(
+        self, mock_split, mock_which, mock_run
+    ):
+        mock_split.return_value = ["echo", "Hello"]
+        mock_which.return_value = "/bin/echo"
+        mock_run.return_value = mock.Mock(stdout="Hello\n", returncode=0)
+
+        util.run_script_with_env_substitution("echo Hello")
+        util.run_script_with_env_substitution("echo Hello")
+
+        mock_split.assert_called_once_with("echo Hello")
+
+    @mock.patch("subprocess.run")
+    @mock.patch("shutil.which")
+    def test_run_script_with_env_substitution_discards_output(
+        self, mock_which, mock_run
+    ):
+        mock_which.return_value = "/bin/check"
+        mock_run.return_value = subprocess.CompletedProcess([], returncode=0)
+
+        output, returncode = util.run_script_with_env_substitution(
+            "check", capture_output=False
+        )
+        self.assertEqual(output, "")
+        self.assertEqual(returncode, 0)
+        mock_run.assert_called_once_with(
+            ["check"],
+            executable="/bin/check",
+            close_fds=False,
+            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    @mock.patch("subprocess.run")
+    @mock.patch("shutil.which")
+    def test_run_script_with_env_substitution_verbose_single_lookup(
+        self, mock_which, mock_run
+    ):
+        mock_which.return_value = None
+        mock_run.return_value = subprocess.CompletedProcess([], stdout="", returncode=0)
+
+        with mock.patch("startout.util._IS_WINDOWS", False), mock.patch(
+            "sys.stderr"
+        ) as mock_stderr:
+            util.run_script_with_env_substitution("missing_command", verbose=True)
+
+        mock_which.assert_called_once_with("missing_command")
+        mock_stderr.write.assert_any_call(
+            "'missing_command' is not installed. Trying script in shell."
+        )
+
+    @mock.patch("subprocess.run")
+    @mock.patch("shutil.which")
+    def test_run_script_with_env_substitution_uncaptured_windows_shell(
+        self, mock_which, mock_run
+    ):
+        mock_which.return_value = None
+        mock_run.return_value = subprocess.CompletedProcess([], returncode=0)
+
+        with mock.patch("startout.util._IS_WINDOWS", True):
+            output, returncode = util.run_script_with_env_substitution("Write-Host Hi")
+
+        mock_run.assert_called_once_with(["powershell", "-Command", "Write-Host Hi"])
+        self.assertEqual(output, "")
+        self.assertEqual(returncode, 0)
+
 
 if __name__ == "__main__":
     unittest.main()